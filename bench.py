@@ -0,0 +1,388 @@
+"""
+Frame-cost benchmarks for Tax Season Invaders.
+
+Drives GameScene._update / _draw, MenuScene._draw, EnemyGrid.update, the
+collision pass, draw_document_enemy and draw_explosion through scripted
+scenarios on an offscreen surface (SDL dummy video driver). game.py and
+game_web.py both run the tax_invaders engine, so one run covers both
+builds. Reports p50/p95/p99 frame time, net memory-block growth per frame
+and, with --trace, peak traced bytes per frame.
+
+    python bench.py                          # table on stdout
+    python bench.py --json bench.json        # machine-readable results
+    python bench.py --compare old.json       # diff against an earlier run
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from tax_invaders.config import SCREEN_W, SCREEN_H, IN_LEFT, IN_RIGHT, IN_FIRE
+from tax_invaders.config import EXPLOSION_FRAMES
+from tax_invaders.sprites import draw_document_enemy, get_enemy_sprite, draw_explosion
+from tax_invaders.particles import ExplosionPool
+from tax_invaders.assets import preload
+from tax_invaders.waves import Wave, make_wave
+from tax_invaders.render import load_fonts
+from tax_invaders.scenes import MenuScene, GameScene
+
+ENGINE = 'tax_invaders'
+SEED = 1234
+
+
+# ─────────────────────────────────────────────
+#  SCENARIOS
+# ─────────────────────────────────────────────
+# Each scenario builds its state once and returns step(frame) -> None; the
+# step keeps the scene in the intended shape (full grid, bullet flood, ...).
+
+def _keep_alive(scene):
+    """Never let a benchmark end in game over / wave clear."""
+    scene.player.lives = scene.player.lives or 1
+    scene.player.invincible = 2
+    if scene.state != 'playing':
+        scene.state = 'playing'
+
+
+def _inputs(frame):
+    return IN_FIRE | (IN_LEFT if (frame // 45) % 2 else IN_RIGHT)
+
+
+def scenario_full_wave(scene):
+    def step(frame):
+        _keep_alive(scene)
+        if scene.grid.alive_count < len(scene.grid.enemies) // 2 or scene.grid.has_reached_bottom():
+            scene.grid = make_wave(scene.waves, 1)
+    return step
+
+
+def scenario_near_empty(scene):
+    def reset():
+        scene.grid = make_wave(scene.waves, 1)
+        for e in scene.grid.enemies[:-3]:
+            e.alive = False
+
+    reset()
+
+    def step(frame):
+        _keep_alive(scene)
+        if not scene.grid.alive_count or scene.grid.has_reached_bottom():
+            reset()
+    return step
+
+
+def scenario_particle_storm(scene):
+    def step(frame):
+        _keep_alive(scene)
+        for i in range(6):
+            scene.explosions.spawn(100 + i * 130, 300 + (frame % 7) * 20)
+            scene.particles.spawn(100 + i * 130, 300 + (frame % 7) * 20, 40)
+    return step
+
+
+def scenario_bullet_flood(scene):
+    def step(frame):
+        _keep_alive(scene)
+        if frame % 2 == 0:
+            for i in range(12):
+                x = 20 + i * 72 + frame % 30
+                scene.player_bullets.fire(x, SCREEN_H - 60)
+                scene.enemy_bullets.fire(x + 36, 60)
+        if not scene.grid.alive_count or scene.grid.has_reached_bottom():
+            scene.grid = make_wave(scene.waves, 1)
+    return step
+
+
+# Two stacked 5x15 formations: 150 enemies marching in opposite directions
+SWARM = [
+    {'rows': 5, 'cols': 15, 'gap_x': 2, 'gap_y': 2, 'y': 46},
+    {'rows': 5, 'cols': 15, 'gap_x': 2, 'gap_y': 2, 'y': 280, 'dx': -1, 'types': [3, 2, 1, 0]},
+]
+
+
+def scenario_swarm(scene):
+    scene.grid = Wave(SWARM)
+
+    def step(frame):
+        _keep_alive(scene)
+        if scene.grid.alive_count < len(scene.grid.enemies) // 2 or scene.grid.has_reached_bottom():
+            scene.grid = Wave(SWARM)
+    return step
+
+
+SCENARIOS = {
+    'full_wave': scenario_full_wave,
+    'near_empty': scenario_near_empty,
+    'particle_storm': scenario_particle_storm,
+    'bullet_flood': scenario_bullet_flood,
+    'swarm': scenario_swarm,
+}
+
+
+# ─────────────────────────────────────────────
+#  MEASUREMENT
+# ─────────────────────────────────────────────
+
+def _percentile(sorted_vals, q):
+    if not sorted_vals:
+        return 0.0
+    k = min(len(sorted_vals) - 1, max(0, int(round(q / 100 * (len(sorted_vals) - 1)))))
+    return sorted_vals[k]
+
+
+def _summarize(times, blocks, peaks):
+    ts = sorted(times)
+    return {
+        'frames': len(ts),
+        'mean_ms': sum(ts) / len(ts) * 1000,
+        'p50_ms': _percentile(ts, 50) * 1000,
+        'p95_ms': _percentile(ts, 95) * 1000,
+        'p99_ms': _percentile(ts, 99) * 1000,
+        'net_block_growth_per_frame': sum(blocks) / len(blocks),
+        'alloc_peak_kb_per_frame': sum(peaks) / len(peaks) / 1024 if peaks else None,
+    }
+
+
+class Timer:
+    """
+    Collects wall time, net block growth and (optionally) peak traced bytes
+    per call. Net block growth is the change in sys.getallocatedblocks():
+    objects kept alive minus objects freed, so it goes negative when a call
+    releases memory and reads ~0 for code that allocates and frees within
+    the call. --trace's peak bytes is the measure of transient allocation.
+    """
+
+    def __init__(self, trace=False):
+        self.trace = trace
+        self.times = []
+        self.blocks = []
+        self.peaks = []
+
+    def __call__(self, fn, *args):
+        if self.trace:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        blocks = sys.getallocatedblocks()
+        t0 = time.perf_counter()
+        fn(*args)
+        t1 = time.perf_counter()
+        self.blocks.append(sys.getallocatedblocks() - blocks)
+        self.times.append(t1 - t0)
+        if self.trace:
+            self.peaks.append(tracemalloc.get_traced_memory()[1] - base)
+
+    def summary(self):
+        return _summarize(self.times, self.blocks, self.peaks)
+
+
+def bench_scenario(screen, fonts, name, frames, warmup, trace):
+    scene = GameScene(screen, fonts, seed=SEED)
+    step = SCENARIOS[name](scene)
+    update, draw = Timer(trace), Timer(trace)
+    # Components are timed inside _update; tracemalloc peaks cannot nest, so they skip tracing.
+    collide, grid_update = Timer(), Timer()
+    real_collide = scene._collide
+    measuring = False
+
+    def timed_collide():
+        if measuring:
+            collide(real_collide)
+        else:
+            real_collide()
+    scene._collide = timed_collide
+
+    for frame in range(warmup + frames):
+        step(frame)
+        measuring = frame >= warmup
+        grid = scene.grid
+        real_grid_update = grid.update
+        if measuring:
+            grid.update = lambda: grid_update(real_grid_update)
+        bits = _inputs(frame)
+        if measuring:
+            update(scene._update, bits)
+            _keep_alive(scene)
+            draw(scene._draw)
+        else:
+            scene._update(bits)
+            _keep_alive(scene)
+            scene._draw()
+        if grid.__dict__.get('update') is not None:
+            del grid.update
+    return {'update': update.summary(), 'collide': collide.summary(),
+            'grid_update': grid_update.summary(), 'draw': draw.summary()}
+
+
+def bench_menu(screen, fonts, frames, warmup, trace):
+    menu = MenuScene(screen, fonts)
+    timer = Timer(trace)
+    for frame in range(warmup + frames):
+        menu.update()
+        if frame < warmup:
+            menu._draw()
+        else:
+            timer(menu._draw)
+    return {'draw': timer.summary()}
+
+
+def bench_enemy_sprites(screen, frames, warmup, trace):
+    """One full grid's worth (40) of enemies per frame: procedural path vs atlas blit."""
+    procedural, atlas = Timer(trace), Timer(trace)
+
+    def draw_procedural():
+        for i in range(40):
+            draw_document_enemy(screen, 20 + (i % 10) * 66, 80 + (i // 10) * 56, i // 10, i % 2)
+
+    def draw_atlas():
+        for i in range(40):
+            screen.blit(get_enemy_sprite(i // 10, i % 2), (20 + (i % 10) * 66, 80 + (i // 10) * 56))
+
+    for frame in range(warmup + frames):
+        if frame < warmup:
+            draw_procedural()
+            draw_atlas()
+        else:
+            procedural(draw_procedural)
+            atlas(draw_atlas)
+    return {'procedural': procedural.summary(), 'atlas': atlas.summary()}
+
+
+def bench_explosions(screen, frames, warmup, trace):
+    """A screenful (12) of explosions at staggered stages: procedural circles vs baked frames."""
+    procedural, baked = Timer(trace), Timer(trace)
+    pool = ExplosionPool()
+    for i in range(12):
+        pool.spawn(60 + i * 70, 300)
+        pool.t += EXPLOSION_FRAMES // 12
+
+    def draw_procedural():
+        for x, y, born in pool.items:
+            draw_explosion(screen, x, y, 4 + (pool.t - born))
+
+    for frame in range(warmup + frames):
+        if frame < warmup:
+            draw_procedural()
+            pool.draw(screen)
+        else:
+            procedural(draw_procedural)
+            baked(pool.draw, screen)
+    return {'procedural': procedural.summary(), 'baked': baked.summary()}
+
+
+def run_all(scenarios, frames, warmup, trace):
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    preload()
+    fonts = load_fonts()
+
+    results = {}
+    for name in scenarios:
+        gc.collect()
+        results[name] = bench_scenario(screen, fonts, name, frames, warmup, trace)
+    gc.collect()
+    results['menu'] = bench_menu(screen, fonts, frames, warmup, trace)
+    results['enemy_sprites'] = bench_enemy_sprites(screen, frames, warmup, trace)
+    results['explosions'] = bench_explosions(screen, frames, warmup, trace)
+    return results
+
+
+# ─────────────────────────────────────────────
+#  REPORTING
+# ─────────────────────────────────────────────
+
+def _git_rev():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def _rows(report):
+    for mod, scen in report['modules'].items():
+        for sname, targets in scen.items():
+            for tname, st in targets.items():
+                yield f"{mod}/{sname}/{tname}", st
+
+
+def print_table(report, baseline=None):
+    base = dict(_rows(baseline)) if baseline else {}
+    print(f"{'benchmark':44s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'net blk':>8s} {'peak KB':>8s}"
+          + ("  p50 vs base" if base else ""))
+    for key, st in _rows(report):
+        peak = st['alloc_peak_kb_per_frame']
+        line = (f"{key:44s} {st['p50_ms']:8.3f} {st['p95_ms']:8.3f} {st['p99_ms']:8.3f} "
+                f"{st['net_block_growth_per_frame']:8.1f} {'-' if peak is None else f'{peak:8.1f}':>8s}")
+        if key in base and base[key]['p50_ms']:
+            line += f"  {(st['p50_ms'] / base[key]['p50_ms'] - 1) * 100:+7.1f}%"
+        print(line)
+
+
+def _count(minimum):
+    """argparse type: an integer no smaller than minimum."""
+    def parse(text):
+        try:
+            n = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {text!r}") from None
+        if n < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}")
+        return n
+    return parse
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Per-frame update/draw benchmarks.")
+    ap.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                    help="run only these scenarios (repeatable)")
+    ap.add_argument('--frames', type=_count(1), default=600)
+    ap.add_argument('--warmup', type=_count(0), default=60)
+    ap.add_argument('--trace', action='store_true',
+                    help="also record peak traced bytes per frame (tracemalloc; slower)")
+    ap.add_argument('--json', metavar='PATH', help="write results as JSON ('-' for stdout)")
+    ap.add_argument('--compare', metavar='PATH', help="show p50 change against an earlier --json file")
+    args = ap.parse_args(argv)
+
+    pygame.init()
+    if args.trace:
+        tracemalloc.start()
+
+    scenarios = args.scenario or list(SCENARIOS)
+    report = {
+        'commit': _git_rev(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'frames': args.frames,
+        'modules': {ENGINE: run_all(scenarios, args.frames, args.warmup, args.trace)},
+    }
+    pygame.quit()
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return 0
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_table(report, baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
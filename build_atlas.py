@@ -0,0 +1,43 @@
+"""
+Build-time sprite atlas for the web bundle.
+
+Bakes every sprite the game blits (enemy frames, bullets, shield, player and
+HUD icons) into one packed image and writes assets/atlas.png plus its
+manifest assets/atlas.json. The browser build loads those at startup instead
+of drawing and scaling each sprite. build_web.bat runs this before pygbag.
+
+    python build_atlas.py
+    python build_atlas.py --out build/atlas.png
+"""
+
+import os
+import sys
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from tax_invaders.assets import ATLAS_PNG, build_atlas
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bake the sprite atlas PNG and manifest.")
+    ap.add_argument('--out', metavar='PATH', default=ATLAS_PNG,
+                    help="atlas image path; the manifest goes next to it as .json")
+    args = ap.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    atlas = build_atlas()
+    manifest = os.path.splitext(args.out)[0] + '.json'
+    atlas.save(args.out, manifest)
+    w, h = atlas.surface.get_size()
+    print(f"{args.out}: {len(atlas.rects)} sprites, {w}x{h}  (+ {manifest})")
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
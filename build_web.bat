@@ -5,18 +5,22 @@
 :: ─────────────────────────────────────────────────────────────────────────────
 
 echo.
-echo  [1/3] Installing / upgrading Pygbag...
+echo  [1/4] Installing / upgrading Pygbag...
 .venv\Scripts\python.exe -m pip install --upgrade pygbag
 
 echo.
-echo  [2/3] Building WASM bundle...
+echo  [2/4] Baking the sprite atlas (assets\atlas.png)...
+.venv\Scripts\python.exe build_atlas.py
+
+echo.
+echo  [3/4] Building WASM bundle...
 ::  Pygbag expects the entry-point file to be named  main.py  at the project root.
 copy /Y game_web.py main.py
 
 .venv\Scripts\python.exe -m pygbag --build --width 900 --height 700 --title "Tax Season Invaders" .
 
 echo.
-echo  [3/3] Cleaning up temporary main.py...
+echo  [4/4] Cleaning up temporary main.py...
 del main.py
 
 echo.
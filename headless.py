@@ -0,0 +1,204 @@
+"""
+Headless simulation runner for Tax Season Invaders.
+
+Steps GameScene logic (_update / _update_wave_clear) as fast as the CPU
+allows: no display surface, no fonts, no frame clock, no event queue.
+Input comes from a policy  policy(scene, frame) -> IN_* bitmask.
+
+    python headless.py --runs 1000 --policy track --seed 1 --jobs 8
+    python headless.py --policy script --script inputs.txt --json
+    python headless.py --seed 7 --record run.tsr      # then:  game.py --replay run.tsr
+    python headless.py --replay run.tsr               # fast-forward a recording
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import multiprocessing
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from tax_invaders.config import IN_LEFT, IN_RIGHT, IN_FIRE
+from tax_invaders.rng import new_seed
+from tax_invaders.cli import seed_arg
+from tax_invaders.replay import SEED_LIMIT, ReplayReader, ReplayWriter
+from tax_invaders.scenes import GameScene
+from tax_invaders.waves import load_waves
+
+MAX_FRAMES = 60 * 60 * 10    # 10 minutes of game time
+
+
+# ─────────────────────────────────────────────
+#  POLICIES
+# ─────────────────────────────────────────────
+
+def idle_policy(scene, frame):
+    """Never moves, never shoots."""
+    return 0
+
+
+def random_policy(rng=None, hold=20):
+    """Mash fire and wander, holding each direction for `hold` frames."""
+    rng = rng or random.Random()
+    state = {'bits': 0}
+
+    def policy(scene, frame):
+        if frame % hold == 0:
+            state['bits'] = rng.choice((0, IN_LEFT, IN_RIGHT)) | IN_FIRE
+        return state['bits']
+    return policy
+
+
+def track_policy(scene, frame):
+    """Slide under the lowest alive enemy and keep firing."""
+    alive = scene.grid.alive_enemies
+    if not alive:
+        return 0
+    target = max(alive, key=lambda e: e.y)
+    px = scene.player.x + scene.player.W // 2
+    tx = target.x + target.W // 2
+    bits = IN_FIRE
+    if tx < px - 4:
+        bits |= IN_LEFT
+    elif tx > px + 4:
+        bits |= IN_RIGHT
+    return bits
+
+
+def script_policy(inputs):
+    """Replay a fixed sequence of bitmasks; idles once the script runs out."""
+    inputs = list(inputs)
+
+    def policy(scene, frame):
+        return inputs[frame] if frame < len(inputs) else 0
+    return policy
+
+
+def load_script(path):
+    """Read a whitespace-separated list of integer bitmasks."""
+    with open(path) as f:
+        return [int(tok, 0) for tok in f.read().split()]
+
+
+# ─────────────────────────────────────────────
+#  ENGINE
+# ─────────────────────────────────────────────
+
+def replay_policy(reader):
+    """Feed a ReplayReader's frames; returns None (ending the run) when it runs out."""
+    def policy(scene, frame):
+        return reader.next_input()
+    return policy
+
+
+def run_headless(policy, max_frames=MAX_FRAMES, seed=None, recorder=None, waves=None):
+    """
+    Play one game to completion (or max_frames) without rendering.
+    The policy may return None to stop early. Returns a summary dict of the final state.
+    """
+    scene = GameScene(None, None, seed=seed, waves=waves)
+    frame = 0
+    ticks = 0
+    while frame < max_frames and scene.state not in ('game_over', 'victory'):
+        if scene.state == 'playing':
+            bits = policy(scene, ticks)
+            if bits is None:
+                break
+            if recorder is not None:
+                recorder.record(bits)
+            scene._update(bits)
+            ticks += 1
+        elif scene.state == 'wave_clear':
+            scene._update_wave_clear()
+        frame += 1
+
+    return {
+        'seed': scene.seed,
+        'frames': frame,
+        'ticks': ticks,
+        'state': scene.state,
+        'score': scene.player.score,
+        'wave': scene.wave,
+        'lives': scene.player.lives,
+    }
+
+
+def _make_policy(name, script, seed):
+    if name == 'idle':
+        return idle_policy
+    if name == 'random':
+        return random_policy(random.Random(seed))
+    if name == 'track':
+        return track_policy
+    return script_policy(script)
+
+
+def _run_job(job):
+    """Run one (policy_name, script, max_frames, seed, waves) job; picklable for multiprocessing."""
+    name, script, max_frames, seed, waves = job
+    return run_headless(_make_policy(name, script, seed), max_frames, seed, waves=waves)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run Tax Season Invaders without a display.")
+    ap.add_argument('--runs', type=int, default=1)
+    ap.add_argument('--frames', type=int, default=MAX_FRAMES, help="frame cap per run")
+    ap.add_argument('--seed', type=seed_arg, default=None, help="base seed; run i uses seed + i")
+    ap.add_argument('--policy', choices=('idle', 'random', 'track', 'script'), default='track')
+    ap.add_argument('--script', help="bitmask file for --policy script")
+    ap.add_argument('--json', action='store_true', help="one JSON object per run on stdout")
+    ap.add_argument('--jobs', type=int, default=1, help="worker processes")
+    ap.add_argument('--record', metavar='PATH', help="record a single run to PATH")
+    ap.add_argument('--replay', metavar='PATH', help="fast-forward a recorded run and report it")
+    ap.add_argument('--waves', metavar='PATH', help="wave definitions (JSON) instead of the bundled ones")
+    args = ap.parse_args(argv)
+    waves = load_waves(args.waves) if args.waves else None
+
+    if args.replay:
+        with ReplayReader(args.replay) as reader:
+            res = run_headless(replay_policy(reader), args.frames, reader.seed, waves=waves)
+        print(json.dumps(res))
+        return 0
+
+    if args.policy == 'script':
+        if not args.script:
+            ap.error("--policy script needs --script")
+        script = load_script(args.script)
+    else:
+        script = None
+
+    if args.record:
+        if args.runs != 1:
+            ap.error("--record needs --runs 1")
+        seed = args.seed if args.seed is not None else new_seed()
+        with ReplayWriter(args.record, seed) as recorder:
+            res = run_headless(_make_policy(args.policy, script, seed), args.frames, seed, recorder, waves)
+        print(json.dumps(res))
+        return 0
+
+    seeds = [None if args.seed is None else (args.seed + i) % SEED_LIMIT for i in range(args.runs)]
+    jobs = [(args.policy, script, args.frames, seed, waves) for seed in seeds]
+    start = time.perf_counter()
+    if args.jobs > 1:
+        with multiprocessing.Pool(args.jobs) as pool:
+            results = pool.map(_run_job, jobs, chunksize=max(1, len(jobs) // (args.jobs * 4)))
+    else:
+        results = [_run_job(job) for job in jobs]
+    elapsed = time.perf_counter() - start
+    if args.json:
+        for res in results:
+            print(json.dumps(res))
+    else:
+        scores = [r['score'] for r in results]
+        waves = [r['wave'] for r in results]
+        print(f"runs: {len(results)}  in {elapsed:.2f}s  ({len(results) / elapsed * 60:.0f}/min)")
+        print(f"score: min {min(scores)}  mean {sum(scores) / len(scores):.0f}  max {max(scores)}")
+        print(f"wave:  min {min(waves)}  mean {sum(waves) / len(waves):.2f}  max {max(waves)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,23 @@
+"""
+Tax Season Invaders engine, shared by the desktop (game.py) and browser
+(game_web.py) builds.
+
+    config      screen size, colours, tunables, per-build text
+    rng         the single seedable RNG
+    sprites     procedural sprites and their baked caches
+    particles   pooled particle system, explosion animations
+    assets      asset manager: package-relative loading, preload, sprite atlas
+    entities    player, enemy grids, bullets, shields
+    collision   spatial-hash broad-phase
+    render      text cache, background layer, dirty-rect presenter, fonts
+    timing      fixed-timestep accumulator
+    replay      recorded runs (desktop and tools only)
+    cli         command-line argument helpers (desktop and tools only)
+    scenes      MenuScene / GameScene: input handling, simulation, drawing
+    desktop     synchronous runner (clock.tick)
+    web         asyncio runner paced by the browser (pygbag)
+
+Scenes never loop on their own: a runner feeds them events, calls _tick()
+at the fixed rate and _draw() once per frame. Import submodules directly;
+this package does not re-export them so the web bundle only loads what it uses.
+"""
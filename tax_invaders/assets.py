@@ -0,0 +1,118 @@
+"""
+Asset manager: every sprite the game blits, loaded or generated once and
+packed into a single atlas Surface.
+
+Image files are resolved against ASSETS_DIR, never the working directory.
+preload() loads and converts the PNGs, bakes the procedural sprites
+(sprites.bake_sprites()), shelf-packs everything into one Surface and serves
+the sprites.py getters from subsurfaces of it, then bakes the effect frames.
+`python build_atlas.py` writes the same atlas as assets/atlas.png plus a
+JSON manifest; preload(baked=True) (the web build) loads that instead of
+drawing every sprite at startup.
+"""
+
+import os
+import json
+
+import pygame
+
+from .config import ASSETS_DIR, PLAYER_PNG
+from .sprites import bake_sprites, use_atlas
+from .particles import build_effect_frames
+
+ATLAS_VERSION = 1      # bump when a baked sprite changes, so an old atlas.png is ignored
+ATLAS_PNG = os.path.join(ASSETS_DIR, 'atlas.png')
+ATLAS_MANIFEST = os.path.join(ASSETS_DIR, 'atlas.json')
+ATLAS_WIDTH = 512      # px; shelves wrap at this width
+ATLAS_PAD = 1          # px between sprites
+
+
+def asset_path(name):
+    return os.path.join(ASSETS_DIR, name)
+
+
+def load_image(path):
+    """Load an image file, converted for fast alpha blits once a display mode is set."""
+    img = pygame.image.load(path)
+    return img.convert_alpha() if pygame.display.get_surface() is not None else img
+
+
+class Atlas:
+    """Named sprites packed into one Surface; sprite(name) is a subsurface of it."""
+
+    def __init__(self, surface, rects):
+        self.surface = surface
+        self.rects = rects     # {name: Rect}
+        self._sprites = {}
+
+    def sprite(self, name):
+        spr = self._sprites.get(name)
+        if spr is None:
+            spr = self._sprites[name] = self.surface.subsurface(self.rects[name])
+        return spr
+
+    def sprites(self):
+        return {name: self.sprite(name) for name in self.rects}
+
+    @classmethod
+    def pack(cls, sprites, width=ATLAS_WIDTH, pad=ATLAS_PAD):
+        """Shelf-pack {name: Surface}, tallest first, into a new Atlas."""
+        order = sorted(sprites, key=lambda n: (-sprites[n].get_height(), n))
+        rects = {}
+        x = y = shelf_h = 0
+        for name in order:
+            w, h = sprites[name].get_size()
+            if x and x + w > width:
+                x, y, shelf_h = 0, y + shelf_h + pad, 0
+            rects[name] = pygame.Rect(x, y, w, h)
+            x += w + pad
+            shelf_h = max(shelf_h, h)
+        surface = pygame.Surface((width, y + shelf_h), pygame.SRCALPHA)
+        for name, rect in rects.items():
+            surface.blit(sprites[name], rect)   # onto transparent pixels: an exact copy
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return cls(surface, rects)
+
+    def save(self, png=ATLAS_PNG, manifest=ATLAS_MANIFEST):
+        """Write the atlas image and its {name: [x, y, w, h]} manifest."""
+        pygame.image.save(self.surface, png)
+        with open(manifest, 'w') as f:
+            json.dump({'version': ATLAS_VERSION, 'size': list(self.surface.get_size()),
+                       'sprites': {n: list(r) for n, r in sorted(self.rects.items())}}, f, indent=1)
+
+    @classmethod
+    def load(cls, png=ATLAS_PNG, manifest=ATLAS_MANIFEST):
+        """The pre-baked atlas, or None if it is missing or from another ATLAS_VERSION."""
+        try:
+            with open(manifest) as f:
+                meta = json.load(f)
+            if meta.get('version') != ATLAS_VERSION:
+                return None
+            surface = load_image(png)
+        except (OSError, ValueError, pygame.error):
+            return None
+        return cls(surface, {n: pygame.Rect(r) for n, r in meta['sprites'].items()})
+
+
+def build_atlas():
+    """Load the PNGs and bake the procedural sprites into a fresh Atlas."""
+    try:
+        player = load_image(asset_path(PLAYER_PNG))
+    except (OSError, pygame.error):
+        player = None   # HUD and player fall back to draw_player()
+    return Atlas.pack(bake_sprites(player))
+
+
+def preload(baked=False):
+    """
+    Load every image up front (call once after pygame.display.set_mode()),
+    so the first gameplay frame does no loading or scaling. With baked,
+    use assets/atlas.png when it is present and current. Returns the Atlas.
+    """
+    atlas = Atlas.load() if baked else None
+    if atlas is None:
+        atlas = build_atlas()
+    use_atlas(atlas.sprites())
+    build_effect_frames()
+    return atlas
@@ -0,0 +1,16 @@
+"""Command-line helpers shared by desktop.py and headless.py (desktop and tools only)."""
+
+import argparse
+
+from .replay import SEED_LIMIT
+
+
+def seed_arg(text):
+    """argparse type for --seed: an integer in [0, SEED_LIMIT)."""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seed: {text!r}") from None
+    if not 0 <= seed < SEED_LIMIT:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {SEED_LIMIT - 1}")
+    return seed
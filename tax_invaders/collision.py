@@ -0,0 +1,98 @@
+"""Collision broad-phase: a uniform spatial hash per object kind."""
+
+COLLISION_CELL = 64   # px; larger than a bullet, about one enemy wide
+
+
+class SpatialHash:
+    """Uniform grid that buckets (obj, rect) pairs by the cells their rect covers."""
+
+    def __init__(self, cell=COLLISION_CELL):
+        self.cell = cell
+        self.buckets = {}
+        self._seq = 0
+
+    def clear(self):
+        self.buckets.clear()
+        self._seq = 0
+
+    def _keys(self, rect):
+        c = self.cell
+        x0, x1 = rect.left // c, (rect.right - 1) // c
+        y0, y1 = rect.top // c, (rect.bottom - 1) // c
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, obj, rect):
+        entry = (self._seq, obj, rect)
+        self._seq += 1
+        for key in self._keys(rect):
+            self.buckets.setdefault(key, []).append(entry)
+
+    def remove(self, obj, rect):
+        for key in self._keys(rect):
+            bucket = self.buckets.get(key)
+            if bucket:
+                bucket[:] = [en for en in bucket if en[1] is not obj]
+
+    def query(self, rect):
+        """All objects colliding with rect, in insertion order."""
+        hits = {}
+        for key in self._keys(rect):
+            for seq, obj, r in self.buckets.get(key, ()):
+                if seq not in hits and rect.colliderect(r):
+                    hits[seq] = obj
+        return [hits[k] for k in sorted(hits)]
+
+    def first(self, rect):
+        """Earliest-inserted object colliding with rect, or None."""
+        best = None
+        for key in self._keys(rect):
+            for entry in self.buckets.get(key, ()):
+                if (best is None or entry[0] < best[0]) and rect.colliderect(entry[2]):
+                    best = entry
+        return best[1] if best is not None else None
+
+
+class CollisionWorld:
+    """
+    Broad-phase for GameScene._update: answers bullet-vs-enemy, bullet-vs-shield
+    and bullet-vs-player queries so the cost scales with nearby candidates
+    instead of bullets x enemies.
+    """
+
+    def __init__(self):
+        self.enemies = SpatialHash()
+        self.shields = SpatialHash()
+        self.enemy_bullets = SpatialHash()
+        self._grid = None
+        self._grid_moves = -1
+
+    def sync(self, grid, shields, enemy_bullets):
+        """Refresh the hashes for this tick. The enemy hash is only rebuilt after the grid moves."""
+        if grid is not self._grid or grid.moves != self._grid_moves:
+            self._grid = grid
+            self._grid_moves = grid.moves
+            self.enemies.clear()
+            for e in grid.alive_enemies:
+                self.enemies.insert(e, e.rect)
+        self.shields.clear()
+        for sh in shields:
+            if sh.alive:
+                self.shields.insert(sh, sh.rect)
+        self.enemy_bullets.clear()
+        for b in enemy_bullets:
+            self.enemy_bullets.insert(b, b.rect)
+
+    def enemy_at(self, rect):
+        return self.enemies.first(rect)
+
+    def remove_enemy(self, enemy):
+        self.enemies.remove(enemy, enemy.rect)
+
+    def shield_at(self, rect):
+        return self.shields.first(rect)
+
+    def remove_shield(self, shield):
+        self.shields.remove(shield, shield.rect)
+
+    def enemy_bullets_at(self, rect):
+        return self.enemy_bullets.query(rect)
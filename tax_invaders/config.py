@@ -0,0 +1,122 @@
+"""Global configuration: screen, colours, gameplay tunables and per-build text."""
+
+import os
+
+try:
+    import numpy as np
+except ImportError:   # NumPy is optional; the list-based EnemyGrid is used instead
+    np = None
+
+# ─────────────────────────────────────────────
+#  GLOBAL CONFIGURATION
+# ─────────────────────────────────────────────
+SCREEN_W, SCREEN_H = 900, 700
+FPS = 60                 # menu frame rate (desktop)
+TICK_RATE = 60           # fixed simulation ticks per second (all speeds are per tick)
+RENDER_FPS = 144         # desktop gameplay render cap; frames between ticks are interpolated (0 = uncapped)
+MAX_FRAME_TIME = 0.25    # s; longer stalls (window drag, tab switch) are not caught up
+
+# Image files live in assets/ next to the package, whatever the working directory
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+PLAYER_PNG = 'player_sprite.png'
+
+# Colors
+BLACK       = (0,   0,   0)
+WHITE       = (255, 255, 255)
+DARK_BG     = (8,   8,  24)
+GRID_COLOR  = (15,  15,  40)
+RED         = (220,  50,  50)
+GREEN       = (60,  220, 100)
+CYAN        = (0,  210, 255)
+YELLOW      = (255, 220,  50)
+ORANGE      = (255, 140,  30)
+PURPLE      = (160,  60, 220)
+LIGHT_GRAY  = (180, 180, 200)
+DARK_GRAY   = (50,   50,  70)
+DOC_CREAM   = (255, 245, 210)
+DOC_LINE    = (180, 150, 100)
+DOC_DARK    = (120, 90,  50)
+SEAL_RED    = (190,  30,  30)
+PLASMA      = (120, 255, 200)
+PLASMA_DIM  = (40,  140, 100)
+
+# Game
+MAX_LIVES = 5
+ENEMY_ROWS = 4
+ENEMY_COLS = 10
+ENEMY_W, ENEMY_H = 52, 44
+ENEMY_GAP_X, ENEMY_GAP_Y = 14, 12
+PLAYER_SPEED = 6
+BULLET_SPEED = 10
+ENEMY_BULLET_SPEED = 5
+ENEMY_SHOOT_CHANCE = 0.0018  # per frame per enemy
+ENEMY_POINTS = (40, 30, 20, 10)   # by enemy type: Form 1040, W-2, 1099, W-4
+SHIELD_W, SHIELD_H = 53, 29       # bunker polygon plus its outline
+SHIELD_CRATER_R = 5               # px; radius of the hole a bullet carves out of a bunker
+USE_NUMPY_GRID = np is not None   # struct-of-arrays EnemyGrid when NumPy is available
+PARTICLE_CAPACITY = 1024          # live particles; extra spawns are dropped when full
+PARTICLE_COLORS = [ORANGE, YELLOW, RED, WHITE]
+PARTICLE_SIZES = range(2, 6)      # dot radii (px)
+FX_FRAME_BUDGET = 1.25 / TICK_RATE   # s; frames slower than this thin out new particles...
+FX_MIN_DENSITY = 0.25                # ...down to this share of the requested count
+EXPLOSION_FRAMES = 16             # ticks an explosion lasts (one baked frame each)
+EXPLOSION_RADIUS = 20             # px at full size
+TEXT_CACHE_SIZE = 256             # rendered strings kept by render_text()
+DIRTY_RECTS = False               # opt-in: push only changed regions instead of flip()
+DIRTY_FLIP_AREA = 0.5             # ...but flip() once the changed area passes this fraction
+
+# Enemy formation defaults. waves.json can override any of these per formation or per wave.
+FORMATION_DEFAULTS = {
+    'rows': ENEMY_ROWS,
+    'cols': ENEMY_COLS,
+    'types': [0, 1, 2, 3],   # enemy type per row, repeating
+    'points': None,          # points per row, repeating; None = ENEMY_POINTS by type
+    'x': None,               # left edge (px); None = centred
+    'y': 80,                 # top edge (px)
+    'gap_x': ENEMY_GAP_X,
+    'gap_y': ENEMY_GAP_Y,
+    'dx': 1,                 # initial direction: 1 = right, -1 = left
+    'step_x': 18,            # px per sideways move
+    'step_y': 14,            # px per descent
+    'interval': 38,          # ticks between moves with the formation intact...
+    'speedup': 0.8,          # ...minus this many per enemy lost...
+    'min_interval': 8,       # ...down to this
+    'fire_rate': ENEMY_SHOOT_CHANCE,   # chance per tick per enemy that may fire
+    'fire_mode': 'any',      # which enemies may fire: 'any' alive one, or 'front' (bottom of each column)
+}
+FIRE_MODES = ('any', 'front')
+
+# Per-frame input bitmask (what GameScene._update consumes)
+IN_LEFT  = 1
+IN_RIGHT = 2
+IN_FIRE  = 4
+
+# ─────────────────────────────────────────────
+#  PER-BUILD TEXT
+# ─────────────────────────────────────────────
+# The browser build cannot close its tab, and web fonts may lack arrow glyphs,
+# so it gets its own menu options, hints and ASCII-only strings.
+DESKTOP, WEB = 'desktop', 'web'
+
+BUILDS = {
+    DESKTOP: {
+        'title':       "Tax Invaders",
+        'title_line':  "TAX",
+        'subtitle':    "Community Tax – Defeat every form this tax season!",
+        'options':     ("START GAME", "QUIT"),
+        'arrow':       "►",
+        'controls':    "← → : Move    |    SPACE : Shoot    |    ↑↓ : Navigate menu",
+        'enter_hint':  "ENTER → Main Menu",
+        'esc_hint':    "ESC → Quit",
+    },
+    WEB: {
+        'title':       "Tax Season Invaders",
+        'title_line':  "TAX SEASON",
+        'subtitle':    "Community Tax - Defeat every form this tax season!",
+        'options':     ("START GAME", "RESTART MENU"),
+        'arrow':       ">",
+        'controls':    "<- -> : Move    |    SPACE : Shoot    |    ^v : Navigate menu",
+        'enter_hint':  "ENTER -> Main Menu",
+        'esc_hint':    "ESC -> Main Menu",
+    },
+}
@@ -0,0 +1,112 @@
+"""Synchronous desktop runner: clock.tick pacing, replays and command-line flags."""
+
+import argparse
+import contextlib
+
+import pygame
+
+from .config import SCREEN_W, SCREEN_H, FPS, RENDER_FPS, DIRTY_RECTS, DESKTOP, BUILDS
+from .rng import new_seed
+from .cli import seed_arg
+from .assets import preload
+from .render import load_fonts
+from .timing import FixedTimestep
+from .replay import ReplayReader, ReplayWriter
+from .waves import load_waves
+from .scenes import MenuScene, GameScene
+
+
+def run_menu(menu):
+    """
+    Drive a MenuScene, animated at FPS ticks. It only changes on input or
+    when its enemy bob is due, so between redraws the loop sleeps in
+    pygame.event.wait(). Returns 'play' or 'quit'.
+    """
+    # update(ticks) is O(1), so unlike gameplay there is no catch-up to cap
+    stepper = FixedTimestep(FPS, max_frame=float('inf'))
+    while menu.result is None:
+        menu.update(stepper.advance())
+        if menu.needs_redraw():
+            menu._draw()
+        wait = (menu.ticks_until_change() - stepper.alpha) * stepper.dt
+        event = pygame.event.wait(max(1, int(wait * 1000) + 1))
+        if event.type != pygame.NOEVENT:
+            menu.handle_event(event)
+            for event in pygame.event.get():
+                menu.handle_event(event)
+    return menu.result
+
+
+def run_game(game, clock):
+    """Drive a GameScene until it ends. Returns 'menu' or 'quit'."""
+    stepper = FixedTimestep()
+    while True:
+        if game.needs_redraw():
+            game.particles.adapt(clock.tick(RENDER_FPS) / 1000)
+            events = pygame.event.get()
+        else:
+            # Game-over / victory screen is up and final: sleep until there is input
+            events = [pygame.event.wait()]
+        for event in events:
+            action = game.handle_event(event)
+            if action is not None:
+                return action
+
+        # Logic runs at TICK_RATE whatever the frame rate; slow frames catch up here
+        for _ in range(stepper.advance()):
+            if not game._tick():
+                return 'menu'   # replay ran out
+
+        if game.needs_redraw():
+            game._draw(stepper.alpha)
+
+
+def main(argv=None):
+    title = BUILDS[DESKTOP]['title']
+    ap = argparse.ArgumentParser(description=title)
+    ap.add_argument('--seed', type=seed_arg, help="seed every game with this value")
+    ap.add_argument('--record', metavar='PATH', help="record each game's inputs to PATH")
+    ap.add_argument('--replay', metavar='PATH', help="watch a recorded game")
+    ap.add_argument('--waves', metavar='PATH',
+                    help="wave definitions (JSON, see tax_invaders/waves.py); replays need the same file")
+    ap.add_argument('--dirty-rects', action='store_true', default=DIRTY_RECTS,
+                    help="update only changed screen regions (low-end displays)")
+    args = ap.parse_args(argv)
+    waves = load_waves(args.waves) if args.waves else None
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    pygame.display.set_caption(title)
+    clock = pygame.time.Clock()
+    preload()
+
+    fonts = load_fonts()
+
+    if args.replay:
+        with ReplayReader(args.replay) as replay:
+            run_game(GameScene(screen, fonts, replay=replay, dirty_rects=args.dirty_rects, waves=waves),
+                     clock)
+        pygame.quit()
+        return 0
+
+    games = 0
+    while True:
+        menu = MenuScene(screen, fonts, dirty_rects=args.dirty_rects)
+        if run_menu(menu) == 'quit':
+            break
+        games += 1
+        seed = args.seed if args.seed is not None else new_seed()
+        recording = contextlib.nullcontext()
+        if args.record:
+            path = args.record if games == 1 else f"{args.record}.{games}"
+            recording = ReplayWriter(path, seed)
+        # Closed even if the game raises or is interrupted, so the replay stays readable
+        with recording as recorder:
+            game = GameScene(screen, fonts, seed=seed, recorder=recorder,
+                             dirty_rects=args.dirty_rects, waves=waves)
+            result = run_game(game, clock)
+        if result == 'quit':
+            break
+
+    pygame.quit()
+    return 0
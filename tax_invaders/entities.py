@@ -0,0 +1,585 @@
+"""Game objects: player, enemy grids, bullets and shields."""
+
+from itertools import islice
+
+import pygame
+
+from .config import (np, SCREEN_W, SCREEN_H, CYAN, MAX_LIVES, ENEMY_W, ENEMY_H, ENEMY_POINTS,
+                     PLAYER_SPEED, BULLET_SPEED, ENEMY_BULLET_SPEED, FORMATION_DEFAULTS,
+                     USE_NUMPY_GRID, SHIELD_W, SHIELD_H, SHIELD_CRATER_R)
+from .rng import RNG, bernoulli_indices
+from .sprites import (draw_player, draw_document_enemy, get_enemy_sprite, _get_player_sprite,
+                      get_bullet_sprite, draw_bullet_player, draw_bullet_enemy, get_shield_sprite,
+                      get_crater)
+
+
+class Player:
+    W, H = 52, 50
+
+    def __init__(self):
+        self.x = SCREEN_W // 2 - self.W // 2
+        self.prev_x = self.x    # x at the start of the current tick (for interpolation)
+        self.y = SCREEN_H - 80
+        self.lives = MAX_LIVES
+        self.score = 0
+        self.shoot_cooldown = 0
+        self.invincible = 0     # invulnerability frames
+        self.color = CYAN
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.x, self.y, self.W, self.H)
+
+    def move(self, dx):
+        self.x = max(0, min(SCREEN_W - self.W, self.x + dx * PLAYER_SPEED))
+
+    def can_shoot(self):
+        return self.shoot_cooldown <= 0
+
+    def shoot(self, bullets):
+        """Fire one shot into the bullets pool (a BulletPool of PlayerBullet)."""
+        self.shoot_cooldown = 18
+        return bullets.fire(self.x + self.W // 2, self.y)
+
+    def hit(self):
+        if self.invincible > 0:
+            return False
+        self.lives -= 1
+        self.invincible = 90
+        return True
+
+    def update(self):
+        if self.shoot_cooldown > 0:
+            self.shoot_cooldown -= 1
+        if self.invincible > 0:
+            self.invincible -= 1
+
+    def draw(self, surface, alpha=1.0):
+        """Draw between the previous and current tick position; returns the covered rect."""
+        x = round(self.prev_x + (self.x - self.prev_x) * alpha)
+        if self.invincible > 0 and (self.invincible // 8) % 2 == 1:
+            return (x, self.y, 53, 53)  # blink during invulnerability
+        spr = _get_player_sprite()
+        if spr is not None:
+            surface.blit(spr, (x, self.y))
+        else:
+            draw_player(surface, x, self.y, self.color)
+        return (x, self.y, 53, 53)
+
+
+class Enemy:
+    W, H = ENEMY_W, ENEMY_H
+
+    def __init__(self, grid, i, col, row, etype, points):
+        self.grid = grid
+        self.i = i               # slot in grid.enemies
+        self.col = col
+        self.row = row
+        self.anim_frame = 0
+        self.anim_timer = 0
+        self.x = 0
+        self.y = 0
+        # 0=Form 1040, 1=Form W-2, 2=Form 1099, 3=Form W-4
+        self.etype = etype
+        self.points = points
+
+    @property
+    def alive(self):
+        return bool(self.grid.flags[self.i])
+
+    @alive.setter
+    def alive(self, value):
+        self.grid.set_alive(self.i, value)
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.x, self.y, self.W, self.H)
+
+    def update_anim(self):
+        self.anim_timer += 1
+        if self.anim_timer >= 25:
+            self.anim_timer = 0
+            self.anim_frame = 1 - self.anim_frame
+
+    def draw(self, surface):
+        if self.alive:
+            spr = get_enemy_sprite(self.etype, self.anim_frame)
+            if spr is not None:
+                surface.blit(spr, (self.x, self.y))
+            else:
+                draw_document_enemy(surface, self.x, self.y, self.etype, self.anim_frame)
+
+
+class EnemyGrid:
+    """
+    One formation of enemies marching in step. formation overrides any of
+    FORMATION_DEFAULTS (size, type mix, spacing, speed curve, fire rate).
+
+    Alive-tracking is incremental: set_alive() keeps the live count, per-row
+    and per-column counts, the occupied row/column range and the front line
+    (each column's bottom-most enemy) current. Alive enemies all move
+    together, so their bounds are that range plus how far the formation has
+    marched; the border checks cost O(1) and the bottom check O(cols).
+    """
+
+    def __init__(self, formation=None):
+        self.formation = f = dict(FORMATION_DEFAULTS, **(formation or {}))
+        self.rows, self.cols = f['rows'], f['cols']
+        self.cell_w = ENEMY_W + f['gap_x']
+        self.cell_h = ENEMY_H + f['gap_y']
+        self.x0 = f['x'] if f['x'] is not None else (SCREEN_W - self.cols * self.cell_w) // 2
+        self.y0 = f['y']
+        self.off_x = 0           # how far the formation has marched from (x0, y0)
+        self.off_y = 0
+        self.enemies = []
+        self.dx = f['dx']        # horizontal direction
+        self.move_timer = 0
+        self.move_interval = f['interval']  # frames between moves
+        self.fire_rate = f['fire_rate']
+        self.fire_mode = f['fire_mode']
+        self.descend = False
+        self.moves = 0           # bumped whenever enemy positions change
+        self.version = 0         # bumped whenever an enemy dies (or is revived)
+        self._build()
+
+    def _layout(self):
+        """Row-major (col, row, x, y, etype, points) for every slot."""
+        types, points = self.formation['types'], self.formation['points']
+        slots = []
+        for row in range(self.rows):
+            etype = types[row % len(types)] % 4
+            pts = points[row % len(points)] if points else ENEMY_POINTS[etype]
+            for col in range(self.cols):
+                slots.append((col, row, self.x0 + col * self.cell_w, self.y0 + row * self.cell_h,
+                              etype, pts))
+        return slots
+
+    def _build(self):
+        self.enemies = []
+        for i, (col, row, x, y, etype, points) in enumerate(self._layout()):
+            e = Enemy(self, i, col, row, etype, points)
+            e.x = x
+            e.y = y
+            self.enemies.append(e)
+        self._index([True] * len(self.enemies))
+
+    # ── Alive index ──
+
+    def _index(self, flags):
+        """Start the alive index with every slot alive; flags is the per-slot alive store."""
+        rows, cols = self.rows, self.cols
+        self.flags = flags
+        self._alive_count = rows * cols
+        self._alive_cache = None
+        self._front_cache = None
+        self._row_count = [cols] * rows
+        self._col_count = [rows] * cols
+        # Slot of each column's bottom-most alive enemy, -1 once the column is empty
+        self.front = [(rows - 1) * cols + c for c in range(cols)] if rows else [-1] * cols
+        self._min_row = 0
+        self._min_col, self._max_col = 0, cols - 1
+
+    def set_alive(self, i, value):
+        value = bool(value)
+        if bool(self.flags[i]) == value:
+            return
+        self.flags[i] = value
+        self._alive_cache = None
+        self._front_cache = None
+        self.version += 1
+        row, col = divmod(i, self.cols)
+        d = 1 if value else -1
+        self._alive_count += d
+        self._row_count[row] += d
+        self._col_count[col] += d
+        if value:
+            self._revived(i)
+            self.front[col] = max(self.front[col], i)
+            if self._alive_count == 1:
+                self._min_row = row
+                self._min_col = self._max_col = col
+            else:
+                self._min_row = min(self._min_row, row)
+                self._min_col, self._max_col = min(self._min_col, col), max(self._max_col, col)
+            return
+        if self.front[col] == i:
+            j = i - self.cols
+            while j >= 0 and not self.flags[j]:
+                j -= self.cols
+            self.front[col] = max(j, -1)
+        if self._alive_count:
+            while not self._row_count[self._min_row]:
+                self._min_row += 1
+            while not self._col_count[self._min_col]:
+                self._min_col += 1
+            while not self._col_count[self._max_col]:
+                self._max_col -= 1
+
+    def _revived(self, i):
+        # Dead enemies stop marching; put a revived one back in formation
+        e = self.enemies[i]
+        e.x = self.x0 + e.col * self.cell_w + self.off_x
+        e.y = self.y0 + e.row * self.cell_h + self.off_y
+
+    @property
+    def alive_enemies(self):
+        """Alive enemies in slot order. Rebuilt only after a death; do not mutate."""
+        if self._alive_cache is None:
+            self._alive_cache = [e for e in self.enemies if self.flags[e.i]]
+        return self._alive_cache
+
+    @property
+    def alive_count(self):
+        return self._alive_count
+
+    def front_slots(self):
+        """Slots of the front-line enemies, left to right. Rebuilt only after a death; do not mutate."""
+        if self._front_cache is None:
+            self._front_cache = [i for i in self.front if i >= 0]
+        return self._front_cache
+
+    def _bottom_row(self):
+        # The lowest alive enemy is always on the front line
+        return max(self.front) // self.cols
+
+    def bounds(self):
+        """(left, top, right, bottom) in px around the alive enemies, or None if none are left."""
+        if not self._alive_count:
+            return None
+        left = self.x0 + self.off_x
+        top = self.y0 + self.off_y
+        return (left + self._min_col * self.cell_w, top + self._min_row * self.cell_h,
+                left + self._max_col * self.cell_w + ENEMY_W, top + self._bottom_row() * self.cell_h + ENEMY_H)
+
+    def _interval(self, alive, total):
+        """Move interval for `alive` of `total` enemies left (the formation's speed curve)."""
+        f = self.formation
+        return max(f['min_interval'], int(f['interval'] - (total - alive) * f['speedup']))
+
+    # ── Movement ──
+
+    def update(self):
+        n = self._alive_count
+        if not n:
+            return
+
+        self.move_timer += 1
+        # Increase speed as fewer enemies remain
+        self.move_interval = self._interval(n, len(self.enemies))
+
+        if self.descend:
+            self._shift(0, self.formation['step_y'])
+            self.descend = False
+            self.dx *= -1
+            self.move_timer = 0
+            return
+
+        if self.move_timer >= self.move_interval:
+            self.move_timer = 0
+            # Check borders
+            left, _, right, _ = self.bounds()
+            if self.dx > 0 and right >= SCREEN_W - 10:
+                self.descend = True
+            elif self.dx < 0 and left <= 10:
+                self.descend = True
+            else:
+                self._shift(self.dx * self.formation['step_x'], 0)
+
+    def _shift(self, dx, dy):
+        self.off_x += dx
+        self.off_y += dy
+        for e in self.alive_enemies:
+            e.x += dx
+            e.y += dy
+            e.update_anim()
+        self.moves += 1
+
+    def maybe_shoot(self, bullets):
+        """
+        Give every enemy allowed to fire (see fire_mode) its chance to shoot;
+        shots are fired into the bullets pool.
+        """
+        if self.fire_mode == 'front':
+            shooters = [self.enemies[i] for i in self.front_slots()]
+        else:
+            shooters = self.alive_enemies
+        for i in bernoulli_indices(len(shooters), self.fire_rate):
+            e = shooters[i]
+            bullets.fire(e.x + e.W // 2, e.y + e.H)
+
+    def has_reached_bottom(self):
+        if not self._alive_count:
+            return False
+        return self.y0 + self.off_y + self._bottom_row() * self.cell_h + ENEMY_H >= SCREEN_H - 90
+
+
+class EnemyView:
+    """Enemy-compatible view onto one slot of an ArrayEnemyGrid (rendering and scoring)."""
+    __slots__ = ('grid', 'i', 'col', 'row')
+    W, H = ENEMY_W, ENEMY_H
+
+    def __init__(self, grid, i, col, row):
+        self.grid = grid
+        self.i = i
+        self.col = col
+        self.row = row
+
+    @property
+    def x(self):
+        return int(self.grid.xs[self.i])
+
+    @property
+    def y(self):
+        return int(self.grid.ys[self.i])
+
+    @property
+    def etype(self):
+        return int(self.grid.etype[self.i])
+
+    @property
+    def points(self):
+        return int(self.grid.points[self.i])
+
+    @property
+    def anim_frame(self):
+        return self.grid.anim_frame
+
+    alive = Enemy.alive
+    rect = Enemy.rect
+    draw = Enemy.draw
+
+
+class ArrayEnemyGrid(EnemyGrid):
+    """
+    Struct-of-arrays EnemyGrid: x, y, alive, etype and points live in flat
+    NumPy arrays so stepping moves the whole formation in one operation.
+    All alive enemies move together, so the bob animation is shared grid-wide.
+    """
+
+    def _build(self):
+        table = np.array(self._layout(), dtype=np.int64).reshape(-1, 6)
+        cols, rows = table[:, 0], table[:, 1]
+        n = len(table)
+        self.xs = table[:, 2].copy()
+        self.ys = table[:, 3].copy()
+        self.alive = np.ones(n, dtype=bool)
+        self.etype = table[:, 4].copy()
+        self.points = table[:, 5].copy()
+        self.anim_frame = 0
+        self.anim_timer = 0
+        self.enemies = [EnemyView(self, i, int(cols[i]), int(rows[i])) for i in range(n)]
+        self._index(self.alive)
+
+    def _revived(self, i):
+        pass    # dead slots keep marching with the rest
+
+    @property
+    def alive_enemies(self):
+        if self._alive_cache is None:
+            self._alive_cache = [self.enemies[i] for i in np.flatnonzero(self.alive)]
+        return self._alive_cache
+
+    def _update_anim(self):
+        self.anim_timer += 1
+        if self.anim_timer >= 25:
+            self.anim_timer = 0
+            self.anim_frame = 1 - self.anim_frame
+
+    def _shift(self, dx, dy):
+        # Dead slots move too: they are never drawn or hit, and it avoids a masked write.
+        self.off_x += dx
+        self.off_y += dy
+        if dx:
+            self.xs += dx
+        if dy:
+            self.ys += dy
+        self._update_anim()
+        self.moves += 1
+
+    def maybe_shoot(self, bullets):
+        # Same odds as one roll per enemy: a Binomial count, then that many distinct shooters
+        front = self.fire_mode == 'front'
+        n = len(self.front_slots()) if front else self._alive_count
+        k = RNG.np.binomial(n, self.fire_rate) if n else 0
+        if not k:
+            return
+        slots = np.array(self.front_slots()) if front else np.flatnonzero(self.alive)
+        shooters = np.sort(RNG.np.choice(slots, k, replace=False))
+        for i in shooters:
+            bullets.fire(int(self.xs[i]) + ENEMY_W // 2, int(self.ys[i]) + ENEMY_H)
+
+
+def make_enemy_grid(formation=None):
+    """Array-backed grid when NumPy is available, list-based otherwise."""
+    if USE_NUMPY_GRID:
+        return ArrayEnemyGrid(formation)
+    return EnemyGrid(formation)
+
+
+class PlayerBullet:
+    __slots__ = ('x', 'y', 'active', 'rect')
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 4, 14)   # moved in place, never reallocated
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.active = True
+        self.rect.x = x - 2
+        self.rect.y = y - 8
+
+    def update(self):
+        self.y -= BULLET_SPEED
+        self.rect.y = self.y - 8
+        if self.y < -20:
+            self.active = False
+
+    def draw(self, surface, alpha=1.0):
+        y = round(self.y + BULLET_SPEED * (1.0 - alpha))
+        spr = get_bullet_sprite('player')
+        if spr is not None:
+            surface.blit(spr, (self.x - 2, y - 8))
+        else:
+            draw_bullet_player(surface, self.x, y)
+        return (self.x - 2, y - 8, 4, 14)
+
+
+class EnemyBullet:
+    __slots__ = ('x', 'y', 'active', 'rect')
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 4, 12)   # moved in place, never reallocated
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.active = True
+        self.rect.x = x - 2
+        self.rect.y = y
+
+    def update(self):
+        self.y += ENEMY_BULLET_SPEED
+        self.rect.y = self.y
+        if self.y > SCREEN_H + 20:
+            self.active = False
+
+    def draw(self, surface, alpha=1.0):
+        y = round(self.y - ENEMY_BULLET_SPEED * (1.0 - alpha))
+        spr = get_bullet_sprite('enemy')
+        if spr is not None:
+            surface.blit(spr, (self.x - 3, y))
+        else:
+            draw_bullet_enemy(surface, self.x, y)
+        return (self.x - 3, y, 7, 12)
+
+
+class BulletPool:
+    """
+    Recycled bullets of one kind. Live bullets are packed into [0, count) and
+    iterating the pool yields only those; fire() reuses a retired object and
+    only allocates when every slot is live, so the pool grows to the peak
+    bullet count once and then stops allocating. update() compacts in place
+    but keeps firing order, which decides who claims a contested hit.
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.items = []
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return islice(self.items, self.count)
+
+    def clear(self):
+        self.count = 0
+
+    def fire(self, x, y):
+        if self.count < len(self.items):
+            b = self.items[self.count]
+            b.reset(x, y)
+        else:
+            b = self.kind(x, y)
+            self.items.append(b)
+        self.count += 1
+        return b
+
+    def update(self):
+        """Advance every live bullet, then retire the inactive ones."""
+        items = self.items
+        n = 0
+        for i in range(self.count):
+            b = items[i]
+            b.update()
+            if b.active:
+                if i != n:
+                    items[i], items[n] = items[n], b
+                n += 1
+        self.count = n
+
+
+_SOLID_MASKS = {}
+
+def _solid_mask(size):
+    """Filled Mask of a bullet's size, shared per size."""
+    mask = _SOLID_MASKS.get(size)
+    if mask is None:
+        mask = _SOLID_MASKS[size] = pygame.mask.Mask(size, fill=True)
+    return mask
+
+
+class Shield:
+    """
+    Destructible bunker: its own copy of the baked shield Surface plus a Mask
+    of the pixels left. Each hit carves the same crater out of both, so
+    drawing stays one blit however battered the bunker gets.
+    """
+    W, H = SHIELD_W, SHIELD_H
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.rect = pygame.Rect(x, y, self.W, self.H)
+        self.surface = get_shield_sprite().copy()
+        self.mask = pygame.mask.from_surface(self.surface)
+        self.pixels = self.mask.count()
+        self.hits = 0   # craters carved so far; changes whenever the image does
+
+    @property
+    def alive(self):
+        return self.pixels > 0
+
+    def hit(self, rect, down):
+        """
+        Test a bullet occupying rect against what is left of the bunker and,
+        on contact, carve a crater at its leading edge (the top of the contact
+        when travelling down, the bottom when travelling up). Returns True if
+        the bullet hit, False if it missed or passed through a gap.
+        """
+        if not self.rect.colliderect(rect):
+            return False
+        offset = (rect.x - self.x, rect.y - self.y)
+        bullet = _solid_mask(rect.size)
+        if self.mask.overlap(bullet, offset) is None:
+            return False
+        contact = self.mask.overlap_mask(bullet, offset).get_bounding_rects()
+        top = min(r.top for r in contact)
+        bottom = max(r.bottom for r in contact)
+        r = SHIELD_CRATER_R
+        cx = rect.centerx - self.x
+        cy = top if down else bottom - 1
+        hole, crater = get_crater()
+        self.surface.blit(hole, (cx - r, cy - r), special_flags=pygame.BLEND_RGBA_MULT)
+        self.mask.erase(crater, (cx - r, cy - r))
+        self.pixels = self.mask.count()
+        self.hits += 1
+        return True
+
+    def draw(self, surface):
+        if self.pixels:
+            surface.blit(self.surface, (self.x, self.y))
@@ -0,0 +1,240 @@
+"""
+Pooled particle system (list-backed, or NumPy-backed when available) and
+pre-baked explosion animations. Effects are cosmetic: they draw from FX_RNG
+and may thin out on slow frames without touching the simulation.
+"""
+
+import math
+from collections import deque
+
+import pygame
+
+from .config import (np, PARTICLE_CAPACITY, PARTICLE_COLORS, PARTICLE_SIZES, FX_FRAME_BUDGET,
+                     FX_MIN_DENSITY, EXPLOSION_FRAMES, EXPLOSION_RADIUS)
+from .rng import FX_RNG
+from .sprites import draw_explosion
+
+
+# Pre-rendered particle dots: {(color_index, radius): Surface}
+_PARTICLE_DOTS: dict = {}
+# Pre-rendered explosion: one (Surface, half-size) per tick of its life
+_EXPLOSION_FRAMES: list = []
+
+def _particle_dot(ci, size):
+    """Return a cached circle Surface so particles can be drawn with one blits() call."""
+    key = (ci, size)
+    dot = _PARTICLE_DOTS.get(key)
+    if dot is None:
+        dot = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(dot, PARTICLE_COLORS[ci], (size, size), size)
+        _PARTICLE_DOTS[key] = dot
+    return dot
+
+
+def _explosion_frames():
+    """Bake the explosion animation on first use: it grows for half its life, then fades out."""
+    if not _EXPLOSION_FRAMES:
+        grow = EXPLOSION_FRAMES // 2
+        for f in range(EXPLOSION_FRAMES):
+            radius = 4 + (EXPLOSION_RADIUS - 4) * min(f, grow) // grow
+            half = radius + 4 + max(1, radius // 3)
+            surf = pygame.Surface((2 * half + 1, 2 * half + 1), pygame.SRCALPHA)
+            draw_explosion(surf, half, half, radius)
+            if f > grow:
+                surf.set_alpha(255 * (EXPLOSION_FRAMES - f) // (EXPLOSION_FRAMES - grow))
+            _EXPLOSION_FRAMES.append((surf, half))
+    return _EXPLOSION_FRAMES
+
+
+def build_effect_frames():
+    """Bake every particle dot and explosion frame up front (call once after pygame.init)."""
+    for ci in range(len(PARTICLE_COLORS)):
+        for size in PARTICLE_SIZES:
+            _particle_dot(ci, size)
+    _explosion_frames()
+
+
+class ParticlePool:
+    """
+    Fixed-capacity particle store. Position, velocity, life, colour and size
+    live in preallocated parallel lists; live particles are packed into
+    [0, count) and dead slots are recycled by swap-remove. spawn() counts
+    are scaled by density, which adapt() tunes to the frame budget.
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.density = 1.0
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.life = [0] * capacity
+        self.color = [0] * capacity
+        self.size = [0] * capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def adapt(self, frame_time):
+        """Feed the last frame's duration (s): thin out spawns while frames overrun, recover after."""
+        if frame_time > FX_FRAME_BUDGET:
+            self.density = max(FX_MIN_DENSITY, self.density * 0.9)
+        else:
+            self.density = min(1.0, self.density + 0.01)
+
+    def _room(self, n):
+        return min(int(n * self.density + 0.5), self.capacity - self.count)
+
+    def spawn(self, x, y, n):
+        """Emit about n * density particles at (x, y) with random motion, life, colour and size."""
+        n = self._room(n)
+        for i in range(self.count, self.count + n):
+            angle = FX_RNG.uniform(0, 2 * math.pi)
+            speed = FX_RNG.uniform(1, 5)
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = math.cos(angle) * speed
+            self.vy[i] = math.sin(angle) * speed
+            self.life[i] = FX_RNG.randint(15, 35)
+            self.color[i] = FX_RNG.randrange(len(PARTICLE_COLORS))
+            self.size[i] = FX_RNG.choice(PARTICLE_SIZES)
+        self.count += n
+
+    def update(self):
+        i = 0
+        while i < self.count:
+            self.x[i] += self.vx[i]
+            self.y[i] += self.vy[i]
+            self.vy[i] += 0.12
+            self.life[i] -= 1
+            if self.life[i] > 0:
+                i += 1
+                continue
+            last = self.count - 1
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.color, self.size):
+                arr[i] = arr[last]
+            self.count = last
+
+    def _blit_list(self, xs, ys, colors, sizes):
+        return [(_particle_dot(ci, sz), (int(px) - sz, int(py) - sz))
+                for px, py, ci, sz in zip(xs, ys, colors, sizes)]
+
+    def draw(self, surface, alpha=1.0, doreturn=False):
+        """Blit every live particle, stepped back (1 - alpha) ticks; with doreturn, return the rects."""
+        c = self.count
+        if c:
+            back = 1.0 - alpha
+            xs = [x - vx * back for x, vx in zip(self.x[:c], self.vx[:c])]
+            ys = [y - (vy - 0.12) * back for y, vy in zip(self.y[:c], self.vy[:c])]
+            return surface.blits(self._blit_list(xs, ys, self.color[:c], self.size[:c]),
+                                 doreturn=doreturn)
+
+
+class ArrayParticlePool(ParticlePool):
+    """ParticlePool on NumPy arrays: the gravity step and compaction are vectorized."""
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.density = 1.0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self.size = np.zeros(capacity, dtype=np.uint8)
+        self._arrays = (self.x, self.y, self.vx, self.vy, self.life, self.color, self.size)
+
+    def spawn(self, x, y, n):
+        n = self._room(n)
+        if n <= 0:
+            return
+        s = slice(self.count, self.count + n)
+        rng = FX_RNG.np
+        angle = rng.uniform(0, 2 * math.pi, n)
+        speed = rng.uniform(1, 5, n)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = np.cos(angle) * speed
+        self.vy[s] = np.sin(angle) * speed
+        self.life[s] = rng.integers(15, 36, n)
+        self.color[s] = rng.integers(0, len(PARTICLE_COLORS), n)
+        self.size[s] = rng.integers(PARTICLE_SIZES.start, PARTICLE_SIZES.stop, n)
+        self.count += n
+
+    def update(self):
+        c = self.count
+        if not c:
+            return
+        self.x[:c] += self.vx[:c]
+        self.y[:c] += self.vy[:c]
+        self.vy[:c] += 0.12
+        self.life[:c] -= 1
+        live = self.life[:c] > 0
+        if not live.all():
+            keep = np.flatnonzero(live)
+            k = keep.size
+            for arr in self._arrays:
+                arr[:k] = arr[keep]
+            self.count = k
+
+    def draw(self, surface, alpha=1.0, doreturn=False):
+        c = self.count
+        if c:
+            back = 1.0 - alpha
+            xs = self.x[:c] - self.vx[:c] * back
+            ys = self.y[:c] - (self.vy[:c] - 0.12) * back
+            return surface.blits(self._blit_list(xs.tolist(), ys.tolist(),
+                                                 self.color[:c].tolist(), self.size[:c].tolist()),
+                                 doreturn=doreturn)
+
+
+class ExplosionPool:
+    """
+    Explosion animations played from the baked frames: spawning one is an
+    append and drawing them all is one blits() call. Every explosion lives
+    EXPLOSION_FRAMES ticks, so the finished ones are always the oldest.
+    """
+
+    def __init__(self):
+        self.items = deque()   # (x, y, tick spawned)
+        self.t = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def clear(self):
+        self.items.clear()
+
+    def spawn(self, x, y):
+        self.items.append((x, y, self.t))
+
+    def update(self):
+        self.t += 1
+        items = self.items
+        while items and self.t - items[0][2] >= EXPLOSION_FRAMES:
+            items.popleft()
+
+    def draw(self, surface, doreturn=False):
+        """Blit every running explosion; with doreturn, return the rects."""
+        if self.items:
+            frames = _explosion_frames()
+            t = self.t
+            blits = []
+            for x, y, born in self.items:
+                surf, half = frames[t - born]
+                blits.append((surf, (x - half, y - half)))
+            return surface.blits(blits, doreturn=doreturn)
+
+
+def make_particle_pool():
+    """Array-backed pool when NumPy is available, list-based otherwise."""
+    if np is not None:
+        return ArrayParticlePool()
+    return ParticlePool()
@@ -0,0 +1,221 @@
+"""Rendering helpers: text cache, star field, cached background, HUD lives, dirty-rect presenter, fonts."""
+
+from collections import OrderedDict
+
+import pygame
+
+from .config import (SCREEN_W, SCREEN_H, WHITE, DARK_BG, GRID_COLOR, CYAN, LIGHT_GRAY,
+                     MAX_LIVES, TEXT_CACHE_SIZE, DIRTY_FLIP_AREA)
+from .rng import RNG
+from .sprites import get_life_icons
+
+
+# ─────────────────────────────────────────────
+#  TEXT CACHE
+# ─────────────────────────────────────────────
+
+class TextCache:
+    """LRU cache of rendered text Surfaces keyed by (font, string, colour)."""
+
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._surfs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surf = self._surfs.get(key)
+        if surf is not None:
+            self._surfs.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, True, color)
+        self._surfs[key] = surf
+        if len(self._surfs) > self.maxsize:
+            self._surfs.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfs.clear()
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, color):
+    """Antialiased font.render() through the shared LRU cache. Do not mutate the result."""
+    return TEXT_CACHE.render(font, text, color)
+
+
+# ─────────────────────────────────────────────
+#  BACKGROUND STARS
+# ─────────────────────────────────────────────
+class StarField:
+    def __init__(self, count=120):
+        self.stars = [
+            (RNG.randint(0, SCREEN_W),
+             RNG.randint(0, SCREEN_H),
+             RNG.uniform(0.4, 2.2),
+             RNG.choice([WHITE, LIGHT_GRAY, CYAN, (180, 180, 255)]))
+            for _ in range(count)
+        ]
+
+    def draw(self, surface):
+        for sx, sy, size, col in self.stars:
+            r = max(1, int(size))
+            pygame.draw.circle(surface, col, (sx, sy), r)
+
+
+def draw_grid(surface):
+    """Faint 60px backdrop grid."""
+    w, h = surface.get_size()
+    for gx in range(0, w, 60):
+        pygame.draw.line(surface, GRID_COLOR, (gx, 0), (gx, h))
+    for gy in range(0, h, 60):
+        pygame.draw.line(surface, GRID_COLOR, (0, gy), (w, gy))
+
+
+class BackgroundLayer:
+    """
+    Static backdrop (DARK_BG fill, grid, stars and optionally the HUD bar and
+    bottom line) pre-rendered into one Surface. It is rebuilt only when the
+    screen size changes, so each frame starts with a single blit.
+    """
+
+    def __init__(self, stars, hud_chrome=False):
+        self.stars = stars
+        self.hud_chrome = hud_chrome
+        self.surface = None
+
+    def _build(self, size):
+        w, h = size
+        surf = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill(DARK_BG)
+        draw_grid(surf)
+        self.stars.draw(surf)
+        if self.hud_chrome:
+            pygame.draw.rect(surf, (12, 12, 35), (0, 0, w, 44))
+            pygame.draw.line(surf, CYAN, (0, 44), (w, 44), 1)
+            pygame.draw.line(surf, CYAN, (0, h - 50), (w, h - 50), 1)
+        self.surface = surf
+
+    def draw(self, screen):
+        if self.surface is None or self.surface.get_size() != screen.get_size():
+            self._build(screen.get_size())
+        screen.blit(self.surface, (0, 0))
+
+
+# ─────────────────────────────────────────────
+#  HUD LIVES
+# ─────────────────────────────────────────────
+class LivesStrip:
+    """
+    The HUD's row of MAX_LIVES icons composed into one transparent Surface,
+    rebuilt only when the lives count changes; each frame is a single blit.
+    """
+    W, H = 158, 44
+    SLOT = 26
+
+    def __init__(self):
+        self.lives = None
+        self.surface = None
+
+    def _build(self, lives):
+        alive, lost, (dx, dy) = get_life_icons()
+        self.surface = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
+        for i in range(MAX_LIVES):
+            self.surface.blit(alive if i < lives else lost, (i * self.SLOT + dx, dy))
+        self.lives = lives
+
+    def draw(self, screen, lives):
+        """Blit the strip at the right end of the HUD bar; returns the covered rect."""
+        if lives != self.lives:
+            self._build(lives)
+        return screen.blit(self.surface, (SCREEN_W - self.W, 0))
+
+
+class DirtyRenderer:
+    """
+    Opt-in dirty-rectangle presenter. begin() erases last frame's sprites by
+    restoring their rects from the cached BackgroundLayer; the scene then
+    draws and mark()s what it drew; present() pushes only the regions that
+    changed to pygame.display.update(). Rects marked with a key count as
+    unchanged while (rect, key) repeats; key=None means "changes every frame".
+    """
+
+    def __init__(self, screen, bg):
+        self.screen = screen
+        self.bg = bg
+        self.prev_static = set()
+        self.prev_moving = []
+        self.cur_static = set()
+        self.cur_moving = []
+        self.full = True
+
+    def invalidate(self):
+        """Repaint and push the whole screen on the next frame."""
+        self.full = True
+
+    def begin(self):
+        bg = self.bg.surface
+        if self.full or bg is None or bg.get_size() != self.screen.get_size():
+            self.full = True
+            self.bg.draw(self.screen)
+            return
+        blit = self.screen.blit
+        for x, y, w, h, _ in self.prev_static:
+            blit(bg, (x, y), (x, y, w, h))
+        for r in self.prev_moving:
+            blit(bg, r, r)
+
+    def mark(self, rect, key=None):
+        if key is None:
+            self.cur_moving.append(pygame.Rect(rect))
+        else:
+            x, y, w, h = rect
+            self.cur_static.add((x, y, w, h, key))
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+        else:
+            rects = [pygame.Rect(x, y, w, h) for x, y, w, h, _ in self.prev_static ^ self.cur_static]
+            rects += self.prev_moving
+            rects += self.cur_moving
+            sw, sh = self.screen.get_size()
+            if sum(r.w * r.h for r in rects) > sw * sh * DIRTY_FLIP_AREA:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+        self.prev_static, self.cur_static = self.cur_static, set()
+        self.prev_moving, self.cur_moving = self.cur_moving, []
+        self.full = False
+
+
+def _no_mark(rect, key=None):
+    """mark() stand-in when dirty-rect rendering is off."""
+
+
+def load_fonts():
+    """Scene font table. Tries a few system fonts and falls back to the default font."""
+    def load_font(size, bold=False):
+        for name in ("Consolas", "Courier New", "monospace", None):
+            try:
+                return pygame.font.SysFont(name, size, bold=bold)
+            except Exception:
+                continue
+        return pygame.font.Font(None, size)
+
+    return {
+        'title': load_font(68,  bold=True),
+        'big':   load_font(52,  bold=True),
+        'sub':   load_font(30,  bold=False),
+        'menu':  load_font(32,  bold=True),
+        'hud':   load_font(24,  bold=True),
+        'small': load_font(20,  bold=False),
+        'tiny':  load_font(18,  bold=False),
+    }
@@ -0,0 +1,102 @@
+"""Recorded runs: the seed plus one input byte per simulated frame, gzip-streamed."""
+
+import gzip
+import struct
+
+from .config import np, USE_NUMPY_GRID
+
+REPLAY_MAGIC = b"TSIR"
+REPLAY_VERSION = 4             # bump when the simulation changes (RNG use, collision rules)
+REPLAY_FLAG_NUMPY = 1          # recorded with the NumPy-backed enemy grid (particles use FX_RNG,
+                               # so they never affect a replay)
+_REPLAY_HEADER = struct.Struct("<4sBBQ")   # magic, version, flags, seed
+SEED_LIMIT = 2 ** 64           # the header stores the seed as a uint64
+_REPLAY_CHUNK = 4096           # frames buffered between writes / per read
+
+
+def _replay_flags():
+    return REPLAY_FLAG_NUMPY if np is not None and USE_NUMPY_GRID else 0
+
+
+class ReplayWriter:
+    """Stream per-frame input bitmasks to disk; memory use stays flat however long the run."""
+
+    def __init__(self, path, seed):
+        self.f = gzip.open(path, "wb")
+        self.f.write(_REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, _replay_flags(), seed))
+        self.buf = bytearray()
+        self.frames = 0
+
+    def record(self, bits):
+        self.buf.append(bits)
+        self.frames += 1
+        if len(self.buf) >= _REPLAY_CHUNK:
+            self.f.write(self.buf)
+            self.buf.clear()
+
+    def close(self):
+        if self.f is not None:
+            self.f.write(self.buf)
+            self.buf.clear()
+            self.f.close()
+            self.f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ReplayReader:
+    """Stream a recorded run back one input bitmask per frame."""
+
+    def __init__(self, path):
+        self.f = gzip.open(path, "rb")
+        try:
+            self.seed = self._read_header(path)
+        except BaseException:
+            self.f.close()   # __exit__ never runs when __init__ raises
+            raise
+        self.buf = b""
+        self.pos = 0
+        self.frames = 0
+        self.finished = False
+
+    def _read_header(self, path):
+        """Check the header and return the recorded seed; ValueError if this is no usable replay."""
+        try:
+            head = self.f.read(_REPLAY_HEADER.size)
+        except (gzip.BadGzipFile, EOFError) as e:
+            raise ValueError(f"{path}: not a replay file ({e})") from None
+        if len(head) < _REPLAY_HEADER.size:
+            raise ValueError(f"{path}: truncated replay header")
+        magic, version, flags, seed = _REPLAY_HEADER.unpack(head)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path}: not a v{REPLAY_VERSION} replay")
+        if flags != _replay_flags():
+            raise ValueError(f"{path}: recorded {'with' if flags & REPLAY_FLAG_NUMPY else 'without'} "
+                             f"NumPy; playback must match")
+        return seed
+
+    def next_input(self):
+        """Next frame's bitmask, or None once the recording runs out."""
+        if self.pos >= len(self.buf):
+            self.buf = self.f.read(_REPLAY_CHUNK) if not self.finished else b""
+            self.pos = 0
+            if not self.buf:
+                self.finished = True
+                return None
+        bits = self.buf[self.pos]
+        self.pos += 1
+        self.frames += 1
+        return bits
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
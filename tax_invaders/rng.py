@@ -0,0 +1,56 @@
+"""Single seedable source of randomness for the whole game."""
+
+import math
+import random
+
+from .config import np
+
+
+class GameRNG(random.Random):
+    """
+    Game-wide RNG. Seeding it also reseeds the NumPy generator used by the
+    array-backed paths, so one integer seed reproduces a run exactly.
+    """
+
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self.np = np.random.default_rng(a) if np is not None else None
+
+
+RNG = GameRNG()
+
+# Cosmetic effects draw from their own stream: how much they draw follows the
+# frame rate (see ParticlePool.adapt), and that must never shift RNG.
+FX_RNG = GameRNG()
+FX_SEED_SALT = 0x9E3779B97F4A7C15   # FX_RNG's seed is the game seed XOR this
+
+
+def seed_all(seed):
+    """Seed RNG and FX_RNG from one game seed, as two unrelated streams."""
+    RNG.seed(seed)
+    FX_RNG.seed(seed ^ FX_SEED_SALT)
+
+
+def new_seed():
+    """Fresh 32-bit seed for a run that was not given one."""
+    return random.SystemRandom().getrandbits(32)
+
+
+def bernoulli_indices(n, p, rng=RNG):
+    """
+    Yield, in increasing order, the indices in range(n) that pass an
+    independent p-chance roll. Draws geometric gaps between hits instead of
+    one roll per index, so the cost follows the number of hits, not n.
+    """
+    if p <= 0.0:
+        return
+    if p >= 1.0:
+        yield from range(n)
+        return
+    log_q = math.log1p(-p)
+    i = -1
+    while True:
+        i += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if i >= n:
+            return
+        yield i
@@ -0,0 +1,513 @@
+"""Menu and gameplay scenes. Runners (desktop.py, web.py) drive them frame by frame."""
+
+import pygame
+
+from .config import (SCREEN_W, SCREEN_H, WHITE, RED, GREEN, CYAN, YELLOW, LIGHT_GRAY, DARK_GRAY,
+                     ENEMY_W, ENEMY_H, DIRTY_RECTS, IN_LEFT, IN_RIGHT, IN_FIRE,
+                     DESKTOP, BUILDS)
+from .rng import new_seed, seed_all
+from .sprites import get_enemy_preview
+from .particles import make_particle_pool, ExplosionPool
+from .entities import Player, PlayerBullet, EnemyBullet, BulletPool, Shield
+from .waves import default_waves, make_wave
+from .collision import CollisionWorld
+from .render import StarField, BackgroundLayer, LivesStrip, DirtyRenderer, _no_mark, render_text
+
+
+def read_input():
+    """Sample the keyboard into an IN_* bitmask."""
+    keys = pygame.key.get_pressed()
+    bits = 0
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        bits |= IN_LEFT
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        bits |= IN_RIGHT
+    if keys[pygame.K_SPACE] or keys[pygame.K_UP]:
+        bits |= IN_FIRE
+    return bits
+
+
+class MenuScene:
+    """
+    Title screen. Feed it events with handle_event(), advance its animation
+    with update() and call _draw() whenever needs_redraw() until result is
+    set. Between enemy bobs (ticks_until_change()) the menu is static, so
+    runners can sleep instead of redrawing. build picks the BUILDS text
+    table; frame_stats is an optional overlay (the web FrameScheduler)
+    drawn while its show_stats is set.
+    """
+
+    def __init__(self, screen, fonts, build=DESKTOP, dirty_rects=DIRTY_RECTS, frame_stats=None):
+        self.screen = screen
+        self.fonts = fonts
+        self.text = BUILDS[build]
+        self.frame_stats = frame_stats
+        self.stars = StarField(150)
+        self.bg = BackgroundLayer(self.stars)
+        self.dirty = DirtyRenderer(screen, self.bg) if dirty_rects else None
+        self.mark = self.dirty.mark if self.dirty is not None else _no_mark
+        self.t = 0
+        self.selected = 0
+        self.options = list(self.text['options'])
+        self.result = None   # 'play' | 'quit'  (internal state strings, not displayed)
+        self._static = self._layout_static()
+        self._drawn_key = None
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.result = 'quit'
+        elif event.type == pygame.VIDEOEXPOSE:
+            self._drawn_key = None
+            if self.dirty is not None:
+                self.dirty.invalidate()
+        elif event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_UP, pygame.K_w):
+                self.selected = (self.selected - 1) % len(self.options)
+            elif event.key in (pygame.K_DOWN, pygame.K_s):
+                self.selected = (self.selected + 1) % len(self.options)
+            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                if self.selected == 0:
+                    self.result = 'play'
+                else:
+                    self.result = 'quit'
+
+    def update(self, ticks=1):
+        """Advance the menu animation by ticks (FPS per second)."""
+        self.t += ticks
+
+    def ticks_until_change(self):
+        """Ticks until the enemy bob flips; nothing else on the menu moves by itself."""
+        return 25 - self.t % 25
+
+    def _frame_key(self):
+        stats = self.frame_stats is not None and self.frame_stats.show_stats
+        return self.t // 25 % 2, self.selected, stats
+
+    def needs_redraw(self):
+        """Whether _draw() would change the screen. The stats overlay refreshes every frame."""
+        key = self._frame_key()
+        return key != self._drawn_key or key[2]
+
+    def _draw(self):
+        self._drawn_key = self._frame_key()
+        if self.dirty is not None:
+            self.dirty.begin()
+        else:
+            self.bg.draw(self.screen)
+        self._draw_static()
+        self._draw_enemies_preview()
+        self._draw_menu()
+        if self._drawn_key[2]:
+            self.mark(self.frame_stats.draw_stats(self.screen, self.fonts['tiny']))
+        if self.dirty is not None:
+            self.dirty.present()
+        else:
+            pygame.display.flip()
+
+    _LEGEND = (
+        (0, "Form 1040  40 pts", (245, 80, 80)),
+        (1, "Form W-2   30 pts", (100, 200, 120)),
+        (2, "Form 1099  20 pts", (100, 160, 255)),
+        (3, "Form W-4   10 pts", (180, 130, 255)),
+    )
+    _PREVIEW_SIZE = (38, 34)
+
+    def _layout_static(self):
+        """
+        Render the text that never changes (title, subtitle, legend, controls)
+        once, as [(Surface, rect, dirty key)].
+        """
+        fonts, cx = self.fonts, SCREEN_W // 2
+        items = []
+
+        def add(surf, key, **anchor):
+            items.append((surf, surf.get_rect(**anchor), key))
+
+        add(render_text(fonts['title'], self.text['title_line'], CYAN), 'title', center=(cx, 90))
+        add(render_text(fonts['title'], "INVADERS", YELLOW), 'title', center=(cx, 150))
+        add(render_text(fonts['sub'], self.text['subtitle'], LIGHT_GRAY), 'title', center=(cx, 200))
+        for i, (_, label, col) in enumerate(self._LEGEND):
+            add(render_text(fonts['small'], f"= {label}", col), 'legend', topleft=(cx - 154, 238 + i * 55))
+        add(render_text(fonts['tiny'], self.text['controls'], DARK_GRAY), 'controls',
+            center=(cx, SCREEN_H - 22))
+        return items
+
+    def _draw_static(self):
+        for surf, rect, key in self._static:
+            self.mark(self.screen.blit(surf, rect), key)
+
+    def _draw_enemies_preview(self):
+        frame = self.t // 25 % 2
+        ex = SCREEN_W // 2 - 200
+        for i, (et, _, _) in enumerate(self._LEGEND):
+            spr = get_enemy_preview(et, frame, self._PREVIEW_SIZE)
+            self.mark(self.screen.blit(spr, (ex, 230 + i * 55)), frame)
+
+    def _draw_menu(self):
+        mfont = self.fonts['menu']
+        for i, opt in enumerate(self.options):
+            col = YELLOW if i == self.selected else LIGHT_GRAY
+            if i == self.selected:
+                # Fondo seleccionado
+                tw = mfont.size(opt)[0] + 40
+                rx = SCREEN_W // 2 - tw // 2
+                ry = 475 + i * 60 - 10
+                pygame.draw.rect(self.screen, (20, 20, 50), (rx, ry, tw, 46), border_radius=8)
+                pygame.draw.rect(self.screen, CYAN, (rx, ry, tw, 46), 2, border_radius=8)
+                self.mark((rx, ry, tw, 46), 'selected')
+                arrow = render_text(mfont, self.text['arrow'], CYAN)
+                self.mark(self.screen.blit(arrow, (rx - 30, ry + 8)), 'selected')
+            txt = render_text(mfont, opt, col)
+            self.mark(self.screen.blit(txt, txt.get_rect(center=(SCREEN_W // 2, 498 + i * 60))),
+                      i == self.selected)
+
+
+class GameScene:
+    """
+    One game from wave 1 to game over. A runner feeds it events through
+    handle_event(), calls _tick() once per fixed simulation step and
+    _draw(alpha) once per rendered frame. screen and fonts may be None when
+    only ticking (headless.py). waves is a load_waves() list; by default the
+    bundled waves.json.
+    """
+
+    def __init__(self, screen, fonts, build=DESKTOP, seed=None, recorder=None, replay=None,
+                 dirty_rects=DIRTY_RECTS, frame_stats=None, waves=None):
+        self.screen = screen
+        self.fonts = fonts
+        self.text = BUILDS[build]
+        self.waves = waves if waves is not None else default_waves()
+        self.frame_stats = frame_stats
+        self.recorder = recorder   # ReplayWriter: log every frame's input
+        self.replay = replay       # ReplayReader: drive input from a recording
+        if replay is not None:
+            seed = replay.seed
+        # Everything random from here on derives from this seed
+        self.seed = new_seed() if seed is None else seed
+        seed_all(self.seed)
+        self.stars = StarField(120)
+        self.bg = BackgroundLayer(self.stars, hud_chrome=True)
+        self.dirty = DirtyRenderer(screen, self.bg) if dirty_rects else None
+        self.mark = self.dirty.mark if self.dirty is not None else _no_mark
+        self._drawn_state = None
+        self._drawn_end = None   # (state, stats shown) of the end screen on display
+        self._reset()
+
+    def _reset(self):
+        self.player = Player()
+        self.grid = make_wave(self.waves, 1)
+        self.player_bullets = BulletPool(PlayerBullet)
+        self.enemy_bullets = BulletPool(EnemyBullet)
+        self.particles = make_particle_pool()
+        self.explosions = ExplosionPool()
+        self.shields = self._make_shields()
+        self.wave = 1
+        self.t = 0
+        self.state = 'playing'   # 'playing' | 'wave_clear' | 'game_over' | 'victory'  (internal)
+        self.wave_timer = 0
+        self.score_popups = []   # [(x, y, text, timer)]  # score popup list
+        self.collide = CollisionWorld()
+        self._hud_score = (None, None)   # (value, Surface) – HUD dirty tracking
+        self._hud_wave = (None, None)
+        self._hud_lives = LivesStrip()
+        self._overlay = (None, None)     # (state key, (dim layer, fixed text blits))
+        self._final_score = (None, None)
+
+    def _make_shields(self):
+        shields = []
+        n = 4
+        gap = SCREEN_W // (n + 1)
+        for i in range(n):
+            shields.append(Shield(gap * (i + 1) - 26, SCREEN_H - 140))
+        return shields
+
+    def handle_event(self, event):
+        """Apply one pygame event. Returns 'menu' or 'quit' when the scene should end."""
+        if event.type == pygame.QUIT:
+            return 'quit'
+        if event.type == pygame.VIDEOEXPOSE:
+            self._drawn_end = None
+            if self.dirty is not None:
+                self.dirty.invalidate()
+        if event.type == pygame.KEYDOWN:
+            if self.state in ('game_over', 'victory'):
+                if event.key == pygame.K_RETURN:
+                    return 'menu'
+                elif event.key == pygame.K_ESCAPE:
+                    return 'quit'
+            elif self.state == 'playing':
+                if event.key == pygame.K_ESCAPE:
+                    return 'menu'
+        return None
+
+    def _tick(self):
+        """One fixed simulation step. Returns False when a replay has run out."""
+        if self.state == 'playing':
+            bits = self._next_input()
+            if bits is None:
+                return False
+            self._update(bits)
+        elif self.state == 'wave_clear':
+            self._update_wave_clear()
+        return True
+
+    def _next_input(self):
+        bits = self.replay.next_input() if self.replay is not None else read_input()
+        if bits is not None and self.recorder is not None:
+            self.recorder.record(bits)
+        return bits
+
+# ── LOGIC ──────────────────────────────────
+
+    def _update(self, inputs):
+        """Advance one tick of play. inputs is an IN_* bitmask (see read_input)."""
+        self.t += 1
+        self.player.prev_x = self.player.x
+
+        if inputs & IN_LEFT:
+            self.player.move(-1)
+        if inputs & IN_RIGHT:
+            self.player.move(1)
+        if inputs & IN_FIRE and self.player.can_shoot():
+            self.player.shoot(self.player_bullets)
+
+        self.player.update()
+
+        # Move enemy grid
+        self.grid.update()
+
+        # Enemy shots
+        self.grid.maybe_shoot(self.enemy_bullets)
+
+        # Update bullets (spent ones go back to their pool)
+        self.player_bullets.update()
+        self.enemy_bullets.update()
+
+        # Particles and explosions
+        self.particles.update()
+        self.explosions.update()
+
+        # Score popups
+        self.score_popups = [(x, y - 1, txt, t - 1) for x, y, txt, t in self.score_popups if t > 0]
+
+        # Bullet collisions
+        self._collide()
+        if self.state == 'game_over':
+            return
+
+        # ── Enemies reach the bottom ──
+        if self.grid.has_reached_bottom():
+            self.player.lives = 0
+            self.state = 'game_over'
+            return
+
+        # ── Wave cleared ──
+        if not self.grid.alive_count:
+            self.state = 'wave_clear'
+            self.wave_timer = 120
+
+    def _collide(self):
+        """Resolve this frame's bullet hits; may switch state to 'game_over'."""
+        # ── Collision broad-phase ──
+        self.collide.sync(self.grid, self.shields, self.enemy_bullets)
+
+        # ── Player bullet vs enemy collisions ──
+        for b in self.player_bullets:
+            e = self.collide.enemy_at(b.rect)
+            if e is not None:
+                self.collide.remove_enemy(e)
+                e.alive = False
+                b.active = False
+                self.player.score += e.points
+                self.score_popups.append((e.x + e.W // 2, e.y, f"+{e.points}", 45))
+                self.explosions.spawn(e.x + e.W // 2, e.y + e.H // 2)
+                self.particles.spawn(e.x + e.W // 2, e.y + e.H // 2, 8)
+
+        # ── Player bullet vs shield collisions ──
+        for b in self.player_bullets:
+            if b.active:
+                sh = self.collide.shield_at(b.rect)
+                if sh is not None and sh.hit(b.rect, down=False):
+                    b.active = False
+                    if not sh.alive:
+                        self.collide.remove_shield(sh)
+
+        # ── Enemy bullet vs shield collisions ──
+        for b in self.enemy_bullets:
+            sh = self.collide.shield_at(b.rect)
+            if sh is not None and sh.hit(b.rect, down=True):
+                b.active = False
+                if not sh.alive:
+                    self.collide.remove_shield(sh)
+
+        # ── Enemy bullet vs player collisions ──
+        for b in self.collide.enemy_bullets_at(self.player.rect):
+            if b.active:
+                b.active = False
+                if self.player.hit():
+                    self.explosions.spawn(self.player.x + 26, self.player.y + 25)
+                    self.particles.spawn(self.player.x + 26, self.player.y + 25, 12)
+                    if self.player.lives <= 0:
+                        self.state = 'game_over'
+                        return
+
+    def _update_wave_clear(self):
+        self.wave_timer -= 1
+        if self.wave_timer <= 0:
+            self.wave += 1
+            self.grid = make_wave(self.waves, self.wave)
+            self.player_bullets.clear()
+            self.enemy_bullets.clear()
+            self.shields = self._make_shields()
+            self.state = 'playing'
+
+# ── DRAWING ──────────────────────────────────
+
+    def needs_redraw(self):
+        """
+        Whether _draw() would change the screen: always during play, but a
+        game-over or victory screen is final once drawn, so runners can
+        block on input instead of redrawing it.
+        """
+        stats = self.frame_stats is not None and self.frame_stats.show_stats
+        if self.state not in ('game_over', 'victory') or stats:
+            return True
+        return self._drawn_end != (self.state, stats)
+
+    def _draw(self, alpha=1.0):
+        """Render the current state, interpolated alpha (0..1) of the way from the previous tick."""
+        if self.state != 'playing':
+            alpha = 1.0   # the simulation is frozen: there is no next tick to interpolate towards
+        mark = self.mark
+        dirty = self.dirty
+        # Background, grid, stars and HUD chrome (cached)
+        if dirty is not None:
+            # Overlays darken the whole screen: repaint fully while one is up and right after
+            if self.state != 'playing' or self._drawn_state != 'playing':
+                dirty.invalidate()
+            self._drawn_state = self.state
+            dirty.begin()
+        else:
+            self.bg.draw(self.screen)
+
+        # Shields
+        for sh in self.shields:
+            sh.draw(self.screen)
+            mark(sh.rect, sh.hits)
+
+        # Enemies
+        for e in self.grid.alive_enemies:
+            e.draw(self.screen)
+        if dirty is not None:
+            for e in self.grid.alive_enemies:
+                mark((e.x, e.y, ENEMY_W, ENEMY_H), (e.etype, e.anim_frame))
+
+        # Player
+        p = self.player
+        mark(p.draw(self.screen, alpha), p.invincible > 0 and (p.invincible // 8) % 2 == 1)
+
+        # Bullets
+        for b in self.player_bullets:
+            mark(b.draw(self.screen, alpha))
+        for b in self.enemy_bullets:
+            mark(b.draw(self.screen, alpha))
+
+        # Explosions and particles
+        for fx in (self.explosions.draw(self.screen, doreturn=dirty is not None),
+                   self.particles.draw(self.screen, alpha, doreturn=dirty is not None)):
+            if fx:
+                for r in fx:
+                    mark(r)
+
+        # Score popups
+        pfont = self.fonts['small']
+        popup_back = round(1.0 - alpha)   # popups rise 1px per tick
+        for x, y, txt, t in self.score_popups:
+            tc = render_text(pfont, txt, YELLOW)
+            mark(self.screen.blit(tc, tc.get_rect(center=(x, y + popup_back))))
+
+        # HUD
+        self._draw_hud()
+        if self.frame_stats is not None and self.frame_stats.show_stats:
+            mark(self.frame_stats.draw_stats(self.screen, self.fonts['tiny']))
+
+        # Overlays
+        if self.state == 'wave_clear':
+            self._draw_wave_clear()
+        elif self.state == 'game_over':
+            self._draw_game_over()
+        elif self.state == 'victory':
+            self._draw_game_over(victory=True)
+        self._drawn_end = (self.state, self.frame_stats is not None and self.frame_stats.show_stats)
+
+        if dirty is not None:
+            dirty.present()
+        else:
+            pygame.display.flip()
+
+    def _draw_hud(self):
+        # Top bar and bottom line come from BackgroundLayer
+        sf = self.fonts['hud']
+        # Score / wave text is only re-rendered when the value changes
+        if self._hud_score[0] != self.player.score:
+            self._hud_score = (self.player.score,
+                               sf.render(f"SCORE: {self.player.score:06d}", True, YELLOW))
+        if self._hud_wave[0] != self.wave:
+            self._hud_wave = (self.wave, sf.render(f"WAVE: {self.wave}", True, CYAN))
+
+        # Score
+        self.mark(self.screen.blit(self._hud_score[1], (16, 10)), self._hud_score[0])
+
+        # Wave
+        wave_txt = self._hud_wave[1]
+        self.mark(self.screen.blit(wave_txt, wave_txt.get_rect(center=(SCREEN_W // 2, 22))),
+                  self._hud_wave[0])
+
+        # Lives
+        lives_txt = render_text(sf, "LIVES:", LIGHT_GRAY)
+        self.mark(self.screen.blit(lives_txt, (SCREEN_W - 220, 10)), 'lives')
+        self.mark(self._hud_lives.draw(self.screen, self.player.lives), ('lives', self.player.lives))
+
+    def _overlay_layer(self, dim, lines):
+        """
+        Dim layer plus fixed text for the overlay of the current state, built
+        on its first frame and reused until the state (or wave) changes.
+        lines is [(font key, text, colour, centre y offset)].
+        """
+        key = (self.state, self.wave)
+        if self._overlay[0] != key:
+            # Per-surface alpha on an opaque layer blends like a SRCALPHA fill, at a quarter of the memory
+            layer = pygame.Surface((SCREEN_W, SCREEN_H))
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            layer.set_alpha(dim)
+            blits = []
+            for font, text, col, dy in lines:
+                t = render_text(self.fonts[font], text, col)
+                blits.append((t, t.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2 + dy))))
+            self._overlay = (key, (layer, blits))
+        return self._overlay[1]
+
+    def _draw_wave_clear(self):
+        self.t += 1
+        layer, blits = self._overlay_layer(80, (
+            ('big', f"WAVE {self.wave} CLEARED", GREEN, -30),
+            ('sub', f"PREPARING WAVE {self.wave + 1}...", YELLOW, 30),
+        ))
+        self.screen.blit(layer, (0, 0))
+        self.screen.blits(blits, doreturn=False)
+
+    def _draw_game_over(self, victory=False):
+        layer, blits = self._overlay_layer(160, (
+            ('title', "VICTORY!", YELLOW, -100) if victory else ('title', "GAME OVER", RED, -100),
+            ('menu', self.text['enter_hint'], CYAN, 80),
+            ('menu', self.text['esc_hint'], LIGHT_GRAY, 130),
+        ))
+        self.screen.blit(layer, (0, 0))
+        self.screen.blits(blits, doreturn=False)
+
+        # The one line that can change: re-rendered only when the score does
+        if self._final_score[0] != self.player.score:
+            t = self.fonts['sub'].render(f"FINAL SCORE:  {self.player.score:06d}", True, WHITE)
+            self._final_score = (self.player.score, (t, t.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2))))
+        self.screen.blit(*self._final_score[1])
@@ -0,0 +1,345 @@
+"""Procedural sprites and the baked Surfaces that stand in for them at runtime."""
+
+import os
+import math
+
+import pygame
+
+from .config import (ASSETS_DIR, PLAYER_PNG, WHITE, CYAN, RED, GREEN, ORANGE, YELLOW, DARK_GRAY, PLASMA, ENEMY_W, ENEMY_H,
+                     SHIELD_W, SHIELD_H, SHIELD_CRATER_R)
+
+
+# ─────────────────────────────────────────────
+#  SPRITE DRAWING FUNCTIONS
+# ─────────────────────────────────────────────
+
+def draw_player(surface, x, y, color=CYAN):
+    """Generic laser cannon (hexagonal + base)."""
+    cx = x + 26
+    # Base
+    pygame.draw.rect(surface, color, (x + 4, y + 38, 44, 10), border_radius=3)
+    # Body
+    pts_body = [
+        (cx - 22, y + 38),
+        (cx - 14, y + 20),
+        (cx - 8,  y + 20),
+        (cx - 8,  y + 10),
+        (cx + 8,  y + 10),
+        (cx + 8,  y + 20),
+        (cx + 14, y + 20),
+        (cx + 22, y + 38),
+    ]
+    pygame.draw.polygon(surface, color, pts_body)
+    # Cannon
+    pygame.draw.rect(surface, WHITE, (cx - 3, y, 6, 14), border_radius=2)
+    # Decorative lights
+    pygame.draw.circle(surface, WHITE, (cx - 10, y + 30), 3)
+    pygame.draw.circle(surface, WHITE, (cx + 10, y + 30), 3)
+    # Outline
+    pygame.draw.polygon(surface, WHITE, pts_body, 1)
+
+
+# Lazy font cache for sprite number labels (avoids font creation every frame)
+_SPRITE_FONTS: dict = {}
+
+def _sprite_font(size: int):
+    """Return a cached small font for use inside sprite draw functions."""
+    if size not in _SPRITE_FONTS:
+        try:
+            _SPRITE_FONTS[size] = pygame.font.SysFont("Consolas", size, bold=True)
+        except Exception:
+            _SPRITE_FONTS[size] = pygame.font.Font(None, size)
+    return _SPRITE_FONTS[size]
+
+
+def draw_document_enemy(surface, x, y, enemy_type=0, frame=0):
+    """
+    IRS tax-form shaped enemy.
+    enemy_type: 0=Form 1040 (40 pts), 1=Form W-2 (30 pts),
+                2=Form 1099 (20 pts),  3=Form W-4 (10 pts)
+    frame: 0 or 1 for bobbing animation
+    """
+    bob = 2 if frame == 1 else 0   # vertical bounce
+    f14 = _sprite_font(14)
+    f11 = _sprite_font(11)
+
+    if enemy_type == 0:
+        # ── FORM 1040  (most important – red/white, IRS style)
+        ey = y + bob
+        # Paper body
+        pygame.draw.rect(surface, (245, 245, 255), (x + 4, ey + 2, 44, 40), border_radius=2)
+        # Red header bar
+        pygame.draw.rect(surface, (200, 30, 30), (x + 4, ey + 2, 44, 11), border_radius=2)
+        # "1040" in header
+        lbl = f14.render("1040", True, WHITE)
+        surface.blit(lbl, (x + 7, ey + 3))
+        # "IRS" small label below header
+        irs = f11.render("U.S. IRS", True, (160, 30, 30))
+        surface.blit(irs, (x + 6, ey + 15))
+        # Three field lines
+        for i in range(3):
+            pygame.draw.rect(surface, (180, 180, 220), (x + 6, ey + 24 + i * 6, 38, 3))
+        # Outline
+        pygame.draw.rect(surface, (140, 20, 20), (x + 4, ey + 2, 44, 40), 1, border_radius=2)
+
+    elif enemy_type == 1:
+        # ── FORM W-2  (green tinted – wage statement)
+        ey = y + bob
+        # Paper body – pale green
+        pygame.draw.rect(surface, (220, 245, 220), (x + 5, ey + 2, 42, 40), border_radius=2)
+        # Dark green header bar
+        pygame.draw.rect(surface, (20, 110, 50), (x + 5, ey + 2, 42, 11), border_radius=2)
+        # "W-2" in header
+        lbl = f14.render("W-2", True, WHITE)
+        surface.blit(lbl, (x + 11, ey + 3))
+        # Grid of form boxes (W-2 is full of boxes)
+        for row in range(2):
+            for col in range(3):
+                pygame.draw.rect(surface, (60, 140, 80),
+                                 (x + 7 + col * 13, ey + 16 + row * 11, 11, 9), 1)
+        # Outline
+        pygame.draw.rect(surface, (20, 90, 40), (x + 5, ey + 2, 42, 40), 1, border_radius=2)
+
+    elif enemy_type == 2:
+        # ── FORM 1099  (blue/buff – miscellaneous income)
+        ey = y + bob
+        # Paper body – pale yellow
+        pygame.draw.rect(surface, (255, 248, 200), (x + 5, ey + 2, 42, 40), border_radius=2)
+        # Blue header bar
+        pygame.draw.rect(surface, (30, 80, 180), (x + 5, ey + 2, 42, 11), border_radius=2)
+        # "1099" in header
+        lbl = f14.render("1099", True, WHITE)
+        surface.blit(lbl, (x + 7, ey + 3))
+        # Four narrow field lines
+        for i in range(4):
+            pygame.draw.rect(surface, (160, 140, 60), (x + 7, ey + 16 + i * 6, 36, 3))
+        # Outline
+        pygame.draw.rect(surface, (20, 60, 140), (x + 5, ey + 2, 42, 40), 1, border_radius=2)
+
+    else:
+        # ── FORM W-4  (purple/lavender – employee withholding)
+        ey = y + bob
+        # Paper body – pale lavender
+        pygame.draw.rect(surface, (238, 225, 255), (x + 5, ey + 2, 42, 40), border_radius=2)
+        # Purple header bar
+        pygame.draw.rect(surface, (100, 45, 170), (x + 5, ey + 2, 42, 11), border_radius=2)
+        # "W-4" in header
+        lbl = f14.render("W-4", True, WHITE)
+        surface.blit(lbl, (x + 11, ey + 3))
+        # Two field lines
+        for i in range(2):
+            pygame.draw.rect(surface, (140, 100, 190), (x + 7, ey + 16 + i * 9, 36, 3))
+        # Three checkboxes
+        for i in range(3):
+            pygame.draw.rect(surface, (120, 70, 170), (x + 8 + i * 12, ey + 28, 8, 7), 1)
+        # Signature line
+        pygame.draw.rect(surface, (120, 70, 170), (x + 7, ey + 38, 36, 2))
+        # Outline
+        pygame.draw.rect(surface, (80, 35, 140), (x + 5, ey + 2, 42, 40), 1, border_radius=2)
+
+
+# Baked enemy frames from the sprite atlas (see use_atlas()): {(enemy_type, frame): Surface}.
+# draw_document_enemy() stays the source of truth (and the fallback).
+_ENEMY_ATLAS: dict = {}
+_BULLET_SPRITES: dict = {}   # {'player' | 'enemy': Surface}, likewise
+
+def get_enemy_sprite(enemy_type, frame):
+    """Return the baked enemy Surface, or None if the atlas has not been loaded."""
+    return _ENEMY_ATLAS.get((enemy_type % 4, frame))
+
+
+def get_bullet_sprite(kind):
+    """Baked 'player' or 'enemy' bullet, or None if the atlas has not been loaded."""
+    return _BULLET_SPRITES.get(kind)
+
+
+_ENEMY_PREVIEWS: dict = {}
+
+def get_enemy_preview(enemy_type, frame, size):
+    """Enemy scaled to size (the menu legend), baked on first use."""
+    key = (enemy_type % 4, frame, size)
+    surf = _ENEMY_PREVIEWS.get(key)
+    if surf is None:
+        full = get_enemy_sprite(enemy_type, frame)
+        if full is None:
+            full = pygame.Surface((ENEMY_W, ENEMY_H), pygame.SRCALPHA)
+            draw_document_enemy(full, 0, 0, enemy_type, frame)
+        surf = _ENEMY_PREVIEWS[key] = pygame.transform.scale(full, size)
+    return surf
+
+
+# ─────────────────────────────────────────────
+#  PLAYER SPRITE (Community Tax logo)
+# ─────────────────────────────────────────────
+_PLAYER_SPRITE: object = None        # full-size 52×52 pygame.Surface; False once the PNG failed
+_PLAYER_SPRITE_HUD: object = None    # small  22×22 pygame.Surface
+
+def _get_player_sprite():
+    """
+    The Community Tax logo as the player sprite (52×52), normally from the
+    atlas; loaded on first use if assets.preload() was skipped.
+    """
+    global _PLAYER_SPRITE
+    if _PLAYER_SPRITE is None:
+        _PLAYER_SPRITE = False   # falls back to draw_player() if the load fails
+        try:
+            raw = pygame.image.load(os.path.join(ASSETS_DIR, PLAYER_PNG)).convert_alpha()
+            _PLAYER_SPRITE = scale_player_sprite(raw)
+        except Exception:
+            pass
+    return _PLAYER_SPRITE or None
+
+
+def scale_player_sprite(raw):
+    """The loaded logo PNG at player size."""
+    return pygame.transform.smoothscale(raw, (52, 52))
+
+
+def _get_player_sprite_hud():
+    """Small 22×22 version of the player sprite for HUD lives icons."""
+    global _PLAYER_SPRITE_HUD
+    if _PLAYER_SPRITE_HUD is None:
+        base = _get_player_sprite()
+        if base is not None:
+            _PLAYER_SPRITE_HUD = pygame.transform.smoothscale(base, (22, 22))
+    return _PLAYER_SPRITE_HUD
+
+
+_LIFE_ICONS: object = None   # (alive Surface, lost Surface, (dx, dy) within a slot)
+
+def get_life_icons():
+    """
+    HUD lives icons, baked once: the 22×22 logo and a dimmed copy for lost
+    lives, or green / grey draw_player() cannons when the PNG is missing.
+    """
+    global _LIFE_ICONS
+    if _LIFE_ICONS is None:
+        _LIFE_ICONS = _bake_life_icons(_get_player_sprite_hud())
+    return _LIFE_ICONS
+
+
+def _bake_life_icons(hud):
+    if hud is not None:
+        lost = hud.copy()
+        lost.fill((40, 40, 60, 80), special_flags=pygame.BLEND_RGBA_MULT)
+        return hud, lost, (0, 11)
+    icons = []
+    for col in (GREEN, DARK_GRAY):
+        surf = pygame.Surface((52, 48), pygame.SRCALPHA)
+        draw_player(surf, 0, 0, col)
+        icons.append(surf)
+    return icons[0], icons[1], (0, -8)
+
+
+def draw_bullet_player(surface, x, y):
+    pygame.draw.rect(surface, PLASMA, (x - 2, y - 8, 4, 14), border_radius=2)
+    pygame.draw.rect(surface, WHITE, (x - 1, y - 8, 2, 6))
+
+
+def draw_bullet_enemy(surface, x, y):
+    pygame.draw.rect(surface, RED, (x - 2, y, 4, 12), border_radius=2)
+    pygame.draw.circle(surface, ORANGE, (x, y + 3), 3)
+
+
+def draw_shield(surface, x, y, health):
+    if health <= 0:
+        return
+    alpha = int(255 * health / 3)
+    col = (0, min(255, 80 + health * 50), min(255, 120 + health * 40))
+    pts = [
+        (x, y + 20), (x, y + 8), (x + 8, y),
+        (x + 44, y), (x + 52, y + 8), (x + 52, y + 20),
+        (x + 40, y + 28), (x + 12, y + 28)
+    ]
+    pygame.draw.polygon(surface, col, pts)
+    pygame.draw.polygon(surface, WHITE, pts, 1)
+
+
+_SHIELD_SPRITE: object = None   # intact bunker, copied by every Shield
+_CRATER: object = None          # (hole Surface, crater Mask)
+
+def get_shield_sprite():
+    """The intact bunker baked onto an alpha Surface; Shields erode private copies of it."""
+    global _SHIELD_SPRITE
+    if _SHIELD_SPRITE is None:
+        _SHIELD_SPRITE = pygame.Surface((SHIELD_W, SHIELD_H), pygame.SRCALPHA)
+        draw_shield(_SHIELD_SPRITE, 0, 0, 3)
+    return _SHIELD_SPRITE
+
+
+def get_crater():
+    """
+    (hole, mask) for one bullet crater. Blitting hole with BLEND_RGBA_MULT
+    clears exactly the pixels that erasing mask removes, so a Shield's
+    Surface and Mask stay in step.
+    """
+    global _CRATER
+    if _CRATER is None:
+        r = SHIELD_CRATER_R
+        hole = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+        hole.fill((255, 255, 255, 255))
+        pygame.draw.circle(hole, (0, 0, 0, 0), (r, r), r)
+        mask = pygame.mask.from_surface(hole)
+        mask.invert()
+        _CRATER = (hole, mask)
+    return _CRATER
+
+
+_EXPLOSION_SPOKES = [(math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 45)]
+
+def draw_explosion(surface, x, y, radius):
+    """Procedural explosion; at runtime the baked frames in particles.py are blitted instead."""
+    pygame.draw.circle(surface, ORANGE, (x, y), radius)
+    pygame.draw.circle(surface, YELLOW, (x, y), max(1, radius - 4))
+    for cos_a, sin_a in _EXPLOSION_SPOKES:
+        ex = int(x + cos_a * (radius + 4))
+        ey = int(y + sin_a * (radius + 4))
+        pygame.draw.circle(surface, RED, (ex, ey), max(1, radius // 3))
+
+
+# ─────────────────────────────────────────────
+#  ATLAS SOURCES (packed by assets.py)
+# ─────────────────────────────────────────────
+def bake_sprites(player_png=None):
+    """
+    Every sprite that goes into the atlas, as {name: Surface}: enemy frames,
+    bullets, the intact shield, and the player and HUD icons (the logo when
+    player_png is the loaded PNG, draw_player() cannons otherwise).
+    """
+    baked = {}
+    for etype in range(4):
+        for frame in range(2):
+            surf = pygame.Surface((ENEMY_W, ENEMY_H), pygame.SRCALPHA)
+            draw_document_enemy(surf, 0, 0, etype, frame)
+            baked[f'enemy{etype}_{frame}'] = surf
+    surf = pygame.Surface((4, 14), pygame.SRCALPHA)
+    draw_bullet_player(surf, 2, 8)
+    baked['bullet_player'] = surf
+    surf = pygame.Surface((7, 12), pygame.SRCALPHA)
+    draw_bullet_enemy(surf, 3, 0)
+    baked['bullet_enemy'] = surf
+    surf = pygame.Surface((SHIELD_W, SHIELD_H), pygame.SRCALPHA)
+    draw_shield(surf, 0, 0, 3)
+    baked['shield'] = surf
+    hud = None
+    if player_png is not None:
+        baked['player'] = scale_player_sprite(player_png)
+        hud = baked['player_hud'] = pygame.transform.smoothscale(baked['player'], (22, 22))
+    baked['life'], baked['life_lost'], _ = _bake_life_icons(hud)
+    return baked
+
+
+def use_atlas(sprites):
+    """Serve every getter above from {name: Surface} as made by bake_sprites() (atlas subsurfaces)."""
+    global _SHIELD_SPRITE, _PLAYER_SPRITE, _PLAYER_SPRITE_HUD, _LIFE_ICONS
+    for etype in range(4):
+        for frame in range(2):
+            _ENEMY_ATLAS[(etype, frame)] = sprites[f'enemy{etype}_{frame}']
+    _BULLET_SPRITES['player'] = sprites['bullet_player']
+    _BULLET_SPRITES['enemy'] = sprites['bullet_enemy']
+    _SHIELD_SPRITE = sprites['shield']
+    _PLAYER_SPRITE = sprites.get('player', False)
+    _PLAYER_SPRITE_HUD = sprites.get('player_hud')
+    _LIFE_ICONS = (sprites['life'], sprites['life_lost'],
+                   (0, 11) if _PLAYER_SPRITE_HUD is not None else (0, -8))
+    _ENEMY_PREVIEWS.clear()
@@ -0,0 +1,33 @@
+"""Fixed-timestep accumulator shared by the desktop and web runners."""
+
+import time
+
+from .config import TICK_RATE, MAX_FRAME_TIME
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns wall-clock frame time into whole fixed-rate logic
+    ticks. After advance(), alpha (0..1) is how far the clock has run into
+    the next tick, for interpolating between the previous and current state.
+    """
+
+    def __init__(self, rate=TICK_RATE, max_frame=MAX_FRAME_TIME):
+        self.dt = 1.0 / rate
+        self.max_frame = max_frame
+        self.acc = 0.0
+        self.alpha = 0.0
+        self.last = None
+
+    def advance(self, now=None):
+        """Number of ticks due since the previous call."""
+        now = time.perf_counter() if now is None else now
+        if self.last is None:
+            self.last = now
+            return 1
+        self.acc += min(now - self.last, self.max_frame)
+        self.last = now
+        ticks = int(self.acc / self.dt)
+        self.acc -= ticks * self.dt
+        self.alpha = self.acc / self.dt
+        return ticks
@@ -0,0 +1,160 @@
+"""
+Wave definitions, loaded from JSON (tax_invaders/data/waves.json by default):
+
+    {
+      "formations": {"classic": {"rows": 4, "cols": 10}},
+      "waves": [
+        {"formations": ["classic"]},
+        {"fire_rate": 0.003, "fire_mode": "front",
+         "formations": [{"use": "classic", "cols": 5, "x": 40},
+                        {"use": "classic", "cols": 5, "x": 480, "dx": -1}]}
+      ]
+    }
+
+A formation entry is a preset name, or an object with an optional "use"
+preset plus any FORMATION_DEFAULTS keys. Keys set on a wave apply to all of
+its formations; precedence is preset < wave < entry. Past the last wave,
+the last one repeats. "fire_mode": "front" lets only the bottom enemy of each
+column shoot, as in the arcade original.
+"""
+
+import os
+import json
+
+from .config import FORMATION_DEFAULTS, FIRE_MODES
+from .entities import make_enemy_grid
+
+WAVES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'waves.json')
+
+
+def _is_int(v):
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _is_int_list(v):
+    return isinstance(v, list) and bool(v) and all(_is_int(i) for i in v)
+
+
+def _is_rate(v):
+    return _is_number(v) and 0 <= v <= 1   # False for NaN too
+
+
+# What each FORMATION_DEFAULTS value must be, checked at load time so a bad
+# wave file fails at startup rather than when that wave begins.
+_CHECKS = {
+    'rows': (lambda v: _is_int(v) and v >= 1, "a positive integer"),
+    'cols': (lambda v: _is_int(v) and v >= 1, "a positive integer"),
+    'types': (_is_int_list, "a non-empty list of integers"),
+    'points': (lambda v: v is None or _is_int_list(v), "null or a non-empty list of integers"),
+    'x': (lambda v: v is None or _is_number(v), "null or a number"),
+    'fire_rate': (_is_rate, "a number from 0 to 1"),
+    'fire_mode': (lambda v: v in FIRE_MODES, "one of " + ', '.join(FIRE_MODES)),
+}
+_NUMBER = (_is_number, "a number")
+
+
+def load_waves(path=WAVES_PATH):
+    """Parse a wave file into a list of waves, each a list of complete formation dicts."""
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected an object with \"formations\" and \"waves\"")
+    presets = data.get('formations', {})
+    if not isinstance(presets, dict) or not all(isinstance(p, dict) for p in presets.values()):
+        raise ValueError(f"{path}: \"formations\" must map preset names to objects")
+    wave_list = data.get('waves', [])
+    if not isinstance(wave_list, list):
+        raise ValueError(f"{path}: \"waves\" must be a list")
+    waves = []
+    for n, wave in enumerate(wave_list, 1):
+        if not isinstance(wave, dict):
+            raise ValueError(f"{path}: wave {n} must be an object")
+        shared = {k: v for k, v in wave.items() if k != 'formations'}
+        entries = wave.get('formations')
+        if not entries or not isinstance(entries, list):
+            raise ValueError(f"{path}: wave {n} needs a non-empty \"formations\" list")
+        formations = []
+        for i, entry in enumerate(entries, 1):
+            if not isinstance(entry, (str, dict)):
+                raise ValueError(f"{path}: wave {n}, formation {i} must be a preset name or an object")
+            entry = {'use': entry} if isinstance(entry, str) else dict(entry)
+            name = entry.pop('use', None)
+            if name is not None and (not isinstance(name, str) or name not in presets):
+                raise ValueError(f"{path}: wave {n}: unknown formation {name!r}")
+            formation = dict(FORMATION_DEFAULTS)
+            for layer in (presets.get(name, {}), shared, entry):
+                unknown = set(layer) - set(FORMATION_DEFAULTS)
+                if unknown:
+                    raise ValueError(f"{path}: wave {n}: unknown key(s) {', '.join(sorted(unknown))}")
+                formation.update(layer)
+            for key, value in formation.items():
+                ok, expected = _CHECKS.get(key, _NUMBER)
+                if not ok(value):
+                    raise ValueError(f"{path}: wave {n}, formation {i}: {key} must be {expected}, "
+                                     f"not {value!r}")
+            formations.append(formation)
+        waves.append(formations)
+    if not waves:
+        raise ValueError(f"{path}: no waves defined")
+    return waves
+
+_DEFAULT_WAVES = None
+
+def default_waves():
+    """The bundled wave file, parsed once."""
+    global _DEFAULT_WAVES
+    if _DEFAULT_WAVES is None:
+        _DEFAULT_WAVES = load_waves()
+    return _DEFAULT_WAVES
+
+
+class Wave:
+    """
+    All formations of one wave behind the single-grid interface that
+    GameScene, CollisionWorld and the tools use. Each formation marches and
+    bounces on its own.
+    """
+
+    def __init__(self, formations):
+        self.formations = [make_enemy_grid(f) for f in formations]
+        self.enemies = [e for g in self.formations for e in g.enemies]
+        self._alive_key = None
+        self._alive_cache = None
+
+    @property
+    def moves(self):
+        return sum(g.moves for g in self.formations)
+
+    @property
+    def alive_enemies(self):
+        if len(self.formations) == 1:
+            return self.formations[0].alive_enemies
+        key = tuple(g.version for g in self.formations)
+        if key != self._alive_key:
+            self._alive_key = key
+            self._alive_cache = [e for g in self.formations for e in g.alive_enemies]
+        return self._alive_cache
+
+    @property
+    def alive_count(self):
+        return sum(g.alive_count for g in self.formations)
+
+    def update(self):
+        for g in self.formations:
+            g.update()
+
+    def maybe_shoot(self, bullets):
+        for g in self.formations:
+            g.maybe_shoot(bullets)
+
+    def has_reached_bottom(self):
+        return any(g.has_reached_bottom() for g in self.formations)
+
+
+def make_wave(waves, number):
+    """Wave `number` (1-based) of a load_waves() list."""
+    return Wave(waves[min(number, len(waves)) - 1])
@@ -0,0 +1,179 @@
+"""
+Asyncio runner for the browser build (pygbag). Every loop iteration awaits
+FrameScheduler.next_frame(), which yields once per browser animation frame
+so the event loop is never blocked. Press F3 for frame-time stats.
+"""
+
+import sys
+import time
+import asyncio
+from collections import deque
+
+import pygame
+
+from .config import SCREEN_W, SCREEN_H, TICK_RATE, LIGHT_GRAY, DARK_BG, WEB, BUILDS
+from .assets import preload
+from .render import load_fonts
+from .timing import FixedTimestep
+from .scenes import MenuScene, GameScene
+
+SIM_BUDGET = 0.5         # share of a measured browser frame that catch-up ticks may use
+JANK_FACTOR = 1.5        # a frame slower than this x the median frame counts as jank
+STATS_WINDOW = 240       # frames kept for frame-time statistics
+IN_BROWSER = sys.platform == 'emscripten'   # False when running game_web.py natively
+
+
+class FrameScheduler:
+    """
+    Browser-paced frame loop for pygbag. next_frame() yields to the event
+    loop exactly once; pygbag resumes it on the next requestAnimationFrame,
+    so there is no second pacing layer (no clock.tick). The measured frame
+    times give the real frame budget: catch-up ticks stop once they have
+    used SIM_BUDGET of a median frame, and the remaining debt is dropped
+    instead of spiralling. Press F3 in game to show the stats.
+    """
+
+    def __init__(self, rate=TICK_RATE):
+        self.stepper = FixedTimestep(rate)
+        self.frame_times = deque(maxlen=STATS_WINDOW)
+        self.last = None
+        self.now = None
+        self.frames = 0
+        self.janks = 0
+        self.dropped_ticks = 0
+        self.show_stats = False
+        self._median = 1.0 / rate
+        self._stats_text = None
+
+    async def next_frame(self):
+        """Yield to the browser until its next animation frame, then record the frame time."""
+        if IN_BROWSER or self.last is None:
+            await asyncio.sleep(0)
+        else:
+            # Native run (no requestAnimationFrame): pace to the tick rate instead of spinning
+            await asyncio.sleep(max(0.0, self.last + self.stepper.dt - time.perf_counter()))
+        now = time.perf_counter()
+        if self.last is not None:
+            ft = now - self.last
+            self.frame_times.append(ft)
+            if self.frames % 30 == 0:
+                self._median = sorted(self.frame_times)[len(self.frame_times) // 2]
+            if ft > self._median * JANK_FACTOR:
+                self.janks += 1
+        self.last = now
+        self.now = now
+        self.frames += 1
+
+    def ticks(self):
+        """Yield once per simulation tick due this frame, within the measured frame budget."""
+        due = self.stepper.advance(self.now)
+        budget = self._median * SIM_BUDGET
+        start = time.perf_counter()
+        for i in range(due):
+            if i and time.perf_counter() - start > budget:
+                self.dropped_ticks += due - i
+                self.stepper.acc = 0.0
+                return
+            yield
+
+    @property
+    def alpha(self):
+        return self.stepper.alpha
+
+    def stats(self):
+        """Frame-time summary over the last STATS_WINDOW frames (ms)."""
+        ft = sorted(self.frame_times)
+        if not ft:
+            return {'fps': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0,
+                    'janks': self.janks, 'dropped_ticks': self.dropped_ticks}
+        return {
+            'fps': len(ft) / sum(ft),
+            'p50_ms': ft[len(ft) // 2] * 1000,
+            'p95_ms': ft[min(len(ft) - 1, int(len(ft) * 0.95))] * 1000,
+            'max_ms': ft[-1] * 1000,
+            'janks': self.janks,
+            'dropped_ticks': self.dropped_ticks,
+        }
+
+    def toggle_stats(self):
+        self.show_stats = not self.show_stats
+        print("frame stats:", self.stats())   # lands in the browser console
+
+    def draw_stats(self, surface, font):
+        """Blit the stats line (re-rendered twice a second); returns the covered rect."""
+        if self._stats_text is None or self.frames % 30 == 0:
+            st = self.stats()
+            self._stats_text = font.render(
+                f"{st['fps']:5.1f} fps  p50 {st['p50_ms']:4.1f}  p95 {st['p95_ms']:4.1f}  "
+                f"max {st['max_ms']:5.1f} ms  jank {st['janks']}  drop {st['dropped_ticks']}",
+                True, LIGHT_GRAY, (0, 0, 0))
+        return surface.blit(self._stats_text, (6, SCREEN_H - 44))
+
+
+def _is_stats_key(event):
+    return event.type == pygame.KEYDOWN and event.key == pygame.K_F3
+
+
+async def run_menu(menu, sched):
+    """Drive a MenuScene, one iteration per animation frame. Returns 'play' or 'quit'."""
+    while menu.result is None:
+        await sched.next_frame()
+        for event in pygame.event.get():
+            if _is_stats_key(event):
+                sched.toggle_stats()
+            else:
+                menu.handle_event(event)
+        # The menu only changes on input or an animation step: skip the other frames
+        menu.update(sched.stepper.advance(sched.now))
+        if menu.needs_redraw():
+            menu._draw()
+    return menu.result
+
+
+async def run_game(game, sched):
+    """Drive a GameScene until it ends. Returns 'menu' or 'quit'."""
+    sched.stepper = FixedTimestep()
+    while True:
+        await sched.next_frame()
+        for event in pygame.event.get():
+            if _is_stats_key(event):
+                sched.toggle_stats()
+                continue
+            action = game.handle_event(event)
+            if action is not None:
+                return action
+
+        if sched.frame_times:
+            game.particles.adapt(sched.frame_times[-1])
+        for _ in sched.ticks():
+            game._tick()
+
+        if game.needs_redraw():
+            game._draw(sched.alpha)
+
+
+async def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    pygame.display.set_caption(BUILDS[WEB]['title'])
+
+    # Loading screen: show a frame before the (one-off) asset work
+    fonts = load_fonts()
+    screen.fill(DARK_BG)
+    msg = fonts['sub'].render("LOADING...", True, LIGHT_GRAY)
+    screen.blit(msg, msg.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2)))
+    pygame.display.flip()
+    await asyncio.sleep(0)
+    preload(baked=True)   # assets/atlas.png from build_atlas.py, if bundled
+    scheduler = FrameScheduler()   # shared so frame stats span scenes
+
+    # Outer loop: menu -> game -> menu -> ...
+    # In WASM there is no exit, so we loop forever.
+    while True:
+        menu = MenuScene(screen, fonts, build=WEB, frame_stats=scheduler)
+        if await run_menu(menu, scheduler) == 'quit':
+            # Can't close the tab - just restart the menu loop
+            continue
+        game = GameScene(screen, fonts, build=WEB, frame_stats=scheduler)
+        # After any game result (menu / quit), return to menu
+        await run_game(game, scheduler)
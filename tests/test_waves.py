@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from tax_invaders.waves import load_waves, make_wave
+
+
+def write_waves(tmp_path, formation):
+    path = tmp_path / 'waves.json'
+    path.write_text(json.dumps({'waves': [{'formations': [formation]}]}))
+    return str(path)
+
+
+@pytest.mark.parametrize('key, value', [
+    ('rows', '4'),
+    ('rows', -1),
+    ('rows', 0),
+    ('cols', 0),
+    ('cols', 2.5),
+    ('types', []),
+    ('types', [0, 'a']),
+    ('types', 1),
+    ('points', []),
+    ('points', [10, None]),
+    ('x', 'left'),
+    ('interval', None),
+    ('speedup', '0.8'),
+    ('fire_rate', True),
+    ('fire_rate', 1.5),
+    ('fire_rate', -0.01),
+    ('fire_rate', float('nan')),
+    ('dx', [1]),
+    ('fire_mode', 'all'),
+])
+def test_bad_formation_value(tmp_path, key, value):
+    with pytest.raises(ValueError, match=f"wave 1, formation 1: {key} must be"):
+        load_waves(write_waves(tmp_path, {key: value}))
+
+
+@pytest.mark.parametrize('data', [
+    [],
+    {'formations': [], 'waves': [{'formations': [{}]}]},
+    {'formations': {'classic': [4, 10]}, 'waves': [{'formations': ['classic']}]},
+    {'waves': {'formations': [{}]}},
+    {'waves': [['classic']]},
+    {'waves': [{'formations': {}}]},
+    {'waves': [{'formations': 'classic'}]},
+    {'waves': [{'formations': [3]}]},
+    {'waves': [{'formations': [{'use': ['classic']}]}]},
+])
+def test_bad_structure(tmp_path, data):
+    path = tmp_path / 'waves.json'
+    path.write_text(json.dumps(data))
+    with pytest.raises(ValueError):
+        load_waves(str(path))
+
+
+def test_bundled_waves_build():
+    waves = load_waves()
+    for n in range(1, len(waves) + 1):
+        assert make_wave(waves, n).alive_count > 0